@@ -39,6 +39,7 @@ Version: 2.2.0
 
 import sys
 import argparse
+import multiprocessing
 from pathlib import Path
 from typing import List, Optional
 import io
@@ -303,6 +304,9 @@ def print_system_info():
 
 
 if __name__ == '__main__':
+    # Batch conversion can use worker processes; frozen builds need this first
+    multiprocessing.freeze_support()
+
     # Print system info in debug mode
     if '--debug' in sys.argv:
         print_system_info()
@@ -5,6 +5,7 @@ This module provides comprehensive encoding detection with special focus on
 Chinese encodings and automatic fallback mechanisms.
 """
 
+import codecs
 from pathlib import Path
 from typing import Optional, Tuple
 from utils.constants import ENCODING_PRIORITY, CHINESE_ENCODINGS, UTF8_BOM
@@ -13,11 +14,20 @@ from utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 # Try to import charset detection libraries
+CCHARDET_AVAILABLE = False
 CHARSET_NORMALIZER_AVAILABLE = False
 CHARDET_AVAILABLE = False
 
+# cchardet is a fast C detector, preferred for in-memory samples when installed
+try:
+    import cchardet
+    CCHARDET_AVAILABLE = True
+except ImportError:
+    pass
+
 try:
     from charset_normalizer import from_path as detect_charset_normalizer
+    from charset_normalizer import from_bytes as detect_charset_normalizer_bytes
     CHARSET_NORMALIZER_AVAILABLE = True
 except ImportError:
     try:
@@ -26,17 +36,30 @@ except ImportError:
     except ImportError:
         pass
 
+# Byte order marks and the encodings they settle. UTF-32 LE starts with the
+# UTF-16 LE mark, so it must be checked first.
+_BOM_ENCODINGS = (
+    (UTF8_BOM, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
 
 class EncodingDetector:
     """Handles encoding detection for subtitle files with Chinese support."""
     
     @staticmethod
-    def detect_encoding(file_path: Path) -> Optional[str]:
+    def detect_encoding(file_path: Path, max_bytes: Optional[int] = None) -> Optional[str]:
         """
         Detect the encoding of a text file using multiple methods.
         
         Args:
             file_path: Path to the file to analyze
+            max_bytes: Only examine the first max_bytes of the file. Detection
+                settles well within the first 64 KB of a subtitle file, so this
+                avoids reading multi-megabyte files (default: whole file)
             
         Returns:
             Detected encoding name or None if detection failed
@@ -45,6 +68,31 @@ class EncodingDetector:
             >>> encoding = EncodingDetector.detect_encoding(Path("subtitle.srt"))
             >>> print(f"Detected encoding: {encoding}")
         """
+        if max_bytes is not None:
+            with open(file_path, 'rb') as f:
+                sample = f.read(max_bytes)
+            bom_encoding = EncodingDetector._detect_bom(sample)
+            if bom_encoding:
+                logger.debug(f"{file_path.name} starts with a {bom_encoding} BOM")
+                return bom_encoding
+            # The whole file fit in the sample and is plain ASCII
+            if len(sample) < max_bytes and sample.isascii():
+                logger.debug(f"{file_path.name} is plain ASCII")
+                return 'ascii'
+            detected = EncodingDetector._auto_detect_bytes(sample)
+            if detected:
+                logger.debug(f"Auto-detected encoding for {file_path.name} from "
+                             f"{len(sample)} bytes: {detected}")
+                return detected.lower()
+            logger.debug(f"Auto-detection failed for {file_path.name}, trying manual detection")
+            return EncodingDetector._manual_detect_bytes(sample, file_path)
+        
+        with open(file_path, 'rb') as f:
+            bom_encoding = EncodingDetector._detect_bom(f.read(4))
+        if bom_encoding:
+            logger.debug(f"{file_path.name} starts with a {bom_encoding} BOM")
+            return bom_encoding
+        
         # First try automatic detection if available
         detected = EncodingDetector._auto_detect_encoding(file_path)
         if detected:
@@ -55,6 +103,22 @@ class EncodingDetector:
         logger.debug(f"Auto-detection failed for {file_path.name}, trying manual detection")
         return EncodingDetector._manual_detect_encoding(file_path)
     
+    @staticmethod
+    def _detect_bom(data: bytes) -> Optional[str]:
+        """
+        Identify the encoding from a byte order mark.
+        
+        Args:
+            data: Leading bytes of the file
+            
+        Returns:
+            Encoding named by the BOM, or None if data doesn't start with one
+        """
+        for bom, encoding in _BOM_ENCODINGS:
+            if data.startswith(bom):
+                return encoding
+        return None
+    
     @staticmethod
     def _auto_detect_encoding(file_path: Path) -> Optional[str]:
         """
@@ -91,6 +155,91 @@ class EncodingDetector:
         
         return None
     
+    @staticmethod
+    def _auto_detect_bytes(data: bytes) -> Optional[str]:
+        """
+        Use automatic encoding detection libraries on an in-memory sample.
+        
+        Args:
+            data: Leading bytes of the file
+            
+        Returns:
+            Detected encoding or None
+        """
+        if CCHARDET_AVAILABLE:
+            try:
+                result = cchardet.detect(data)
+                if result["encoding"] and (result["confidence"] or 0) >= 0.6:
+                    return result["encoding"]
+            except Exception as e:
+                logger.debug(f"cchardet detection failed: {e}")
+        
+        if CHARSET_NORMALIZER_AVAILABLE:
+            try:
+                result = detect_charset_normalizer_bytes(data)
+                if result and result.best():
+                    return result.best().encoding
+            except Exception as e:
+                logger.debug(f"charset-normalizer detection failed: {e}")
+        
+        if CHARDET_AVAILABLE:
+            try:
+                detector = UniversalDetector()
+                detector.feed(data)
+                detector.close()
+                result = detector.result
+                if result and result["encoding"] and result["confidence"] > 0.7:
+                    return result["encoding"]
+            except Exception as e:
+                logger.debug(f"chardet detection failed: {e}")
+        
+        return None
+    
+    @staticmethod
+    def _manual_detect_bytes(data: bytes, file_path: Path) -> Optional[str]:
+        """
+        Manually detect the encoding of an in-memory sample.
+        
+        Follows the same order as _manual_detect_encoding, except that a
+        BOM has already been handled by _detect_bom. The sample may end
+        partway through a multi-byte character, so it is decoded incrementally
+        and an incomplete trailing sequence is not treated as an error.
+        
+        Args:
+            data: Leading bytes of the file
+            file_path: Path the sample was read from (for logging)
+            
+        Returns:
+            Detected encoding or None
+        """
+        def decode(encoding: str) -> Optional[str]:
+            try:
+                return codecs.getincrementaldecoder(encoding)().decode(data, final=False)
+            except (UnicodeDecodeError, LookupError):
+                return None
+        
+        utf_encodings = ['utf-8', 'utf-8-sig']
+        for encoding in utf_encodings:
+            if decode(encoding) is not None:
+                logger.debug(f"Manual detection successful for {file_path.name}: {encoding}")
+                return encoding
+        
+        for encoding in CHINESE_ENCODINGS:
+            content = decode(encoding)
+            if content is not None and EncodingDetector._has_chinese_characters(content):
+                logger.debug(f"Manual detection successful for {file_path.name}: {encoding}")
+                return encoding
+        
+        remaining_encodings = [enc for enc in ENCODING_PRIORITY 
+                             if enc not in utf_encodings and enc not in CHINESE_ENCODINGS]
+        for encoding in remaining_encodings:
+            if decode(encoding) is not None:
+                logger.debug(f"Manual detection successful for {file_path.name}: {encoding}")
+                return encoding
+        
+        logger.warning(f"Could not detect encoding for {file_path}")
+        return None
+    
     @staticmethod
     def _manual_detect_encoding(file_path: Path) -> Optional[str]:
         """
@@ -264,6 +413,7 @@ class EncodingDetector:
             >>> print(f"charset-normalizer available: {info['charset_normalizer']}")
         """
         return {
+            'cchardet': CCHARDET_AVAILABLE,
             'charset_normalizer': CHARSET_NORMALIZER_AVAILABLE,
             'chardet': CHARDET_AVAILABLE,
             'manual_fallback': True
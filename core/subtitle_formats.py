@@ -149,12 +149,13 @@ class SRTParser(SubtitleParser):
     """Parser for SRT subtitle format."""
     
     @staticmethod
-    def parse(file_path: Path) -> SubtitleFile:
+    def parse(file_path: Path, max_events: Optional[int] = None) -> SubtitleFile:
         """
         Parse an SRT subtitle file.
         
         Args:
             file_path: Path to the SRT file
+            max_events: Stop after this many events (default: parse all)
             
         Returns:
             SubtitleFile object
@@ -175,6 +176,8 @@ class SRTParser(SubtitleParser):
         events = []
         
         for block_idx, block in enumerate(blocks):
+            if max_events is not None and len(events) >= max_events:
+                break
             lines = block.strip().split('\n')
             if len(lines) < 2:
                 continue
@@ -287,12 +290,13 @@ class VTTParser(SubtitleParser):
     """Parser for WebVTT subtitle format."""
 
     @staticmethod
-    def parse(file_path: Path) -> SubtitleFile:
+    def parse(file_path: Path, max_events: Optional[int] = None) -> SubtitleFile:
         """
         Parse a WebVTT subtitle file.
 
         Args:
             file_path: Path to the VTT file
+            max_events: Stop after this many events (default: parse all)
 
         Returns:
             SubtitleFile object
@@ -319,6 +323,8 @@ class VTTParser(SubtitleParser):
         events = []
 
         for block in blocks:
+            if max_events is not None and len(events) >= max_events:
+                break
             lines = block.strip().split('\n')
             if not lines:
                 continue
@@ -400,12 +406,13 @@ class ASSParser(SubtitleParser):
     """Parser for ASS/SSA subtitle format."""
 
     @staticmethod
-    def parse(file_path: Path) -> SubtitleFile:
+    def parse(file_path: Path, max_events: Optional[int] = None) -> SubtitleFile:
         """
         Parse an ASS/SSA subtitle file.
 
         Args:
             file_path: Path to the ASS/SSA file
+            max_events: Stop after this many events (default: parse all)
 
         Returns:
             SubtitleFile object with events, styles, and script info
@@ -467,6 +474,8 @@ class ASSParser(SubtitleParser):
                     except Exception as e:
                         logger.debug(f"Failed to parse dialogue line: {line} - {e}")
                         continue
+                    if max_events is not None and len(events) >= max_events:
+                        break
 
         logger.info(f"Parsed {len(events)} events from ASS file: {file_path.name}")
         return SubtitleFile(
@@ -642,12 +651,14 @@ class SubtitleFormatFactory:
         return cls._parsers[format_type]
 
     @classmethod
-    def parse_file(cls, file_path: Path) -> SubtitleFile:
+    def parse_file(cls, file_path: Path, max_events: Optional[int] = None) -> SubtitleFile:
         """
         Parse a subtitle file automatically detecting the format.
 
         Args:
             file_path: Path to the subtitle file
+            max_events: Stop after this many events, e.g. for previews
+                (default: parse all)
 
         Returns:
             SubtitleFile object
@@ -662,7 +673,7 @@ class SubtitleFormatFactory:
             raise ValueError(f"Unsupported file extension: {file_path.suffix}")
 
         parser = cls.get_parser(format_type)
-        return parser.parse(file_path)
+        return parser.parse(file_path, max_events=max_events)
 
     @classmethod
     def write_file(cls, subtitle_file: SubtitleFile, output_path: Path,
@@ -5,9 +5,11 @@ This module provides functionality for processing multiple subtitle files
 and videos in batch operations with progress tracking and error handling.
 """
 
+import logging
+import multiprocessing
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from utils.logging_config import get_logger
 from utils.file_operations import FileHandler
 from .merger import BilingualMerger
@@ -16,20 +18,53 @@ from .realigner import SubtitleRealigner
 
 logger = get_logger(__name__)
 
+# EncodingConverter reused by every task run in a worker process
+_process_converter: Optional[EncodingConverter] = None
+
+
+def _init_worker_process():
+    """
+    Detach a conversion worker process from the parent's log handlers.
+
+    Results are logged by the parent as they come back, so workers log
+    nowhere rather than into handlers (such as the GUI's) that belong to
+    the parent process.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.NullHandler())
+
+
+def _convert_in_process(file_path: Path, kwargs: Dict[str, Any]) -> Tuple[Path, bool, Optional[str]]:
+    """Convert a single file inside a ProcessPoolExecutor worker."""
+    global _process_converter
+    if _process_converter is None:
+        _process_converter = EncodingConverter()
+    try:
+        modified = _process_converter.convert_file(file_path, **kwargs)
+        return file_path, bool(modified), None
+    except Exception as e:
+        return file_path, False, str(e)
+
 
 class BatchProcessor:
     """Handles batch processing operations for subtitle files."""
 
-    def __init__(self, max_workers: int = 4, auto_confirm: bool = False):
+    def __init__(self, max_workers: int = 4, auto_confirm: bool = False,
+                 use_processes: bool = False):
         """
         Initialize the batch processor.
 
         Args:
-            max_workers: Maximum number of worker threads for parallel processing
+            max_workers: Maximum number of workers for parallel processing
             auto_confirm: Skip interactive confirmations for fully automated processing
+            use_processes: Run parallel encoding conversions in worker processes
+                instead of threads, so detection is not serialized by the GIL
         """
         self.max_workers = max_workers
         self.auto_confirm = auto_confirm
+        self.use_processes = use_processes
         self.merger = BilingualMerger()
         self.converter = EncodingConverter()
         self.realigner = SubtitleRealigner()
@@ -95,6 +130,7 @@ class BatchProcessor:
     def process_subtitles_batch(self, subtitle_paths: List[Path],
                                operation: str = "convert",
                                parallel: bool = True,
+                               progress_callback: Optional[Callable[[int, int], None]] = None,
                                **kwargs) -> Dict[str, Any]:
         """
         Process multiple subtitle files in batch.
@@ -103,6 +139,8 @@ class BatchProcessor:
             subtitle_paths: List of subtitle file paths
             operation: Operation to perform ('convert', 'realign')
             parallel: Whether to use parallel processing
+            progress_callback: Optional callback function(done, total), called
+                after each parallel conversion finishes
             **kwargs: Additional arguments for the operation
             
         Returns:
@@ -127,7 +165,8 @@ class BatchProcessor:
         
         if operation == "convert":
             if parallel:
-                return self._process_convert_parallel(subtitle_paths, results, **kwargs)
+                return self._process_convert_parallel(subtitle_paths, results,
+                                                      progress_callback, **kwargs)
             else:
                 return self._process_convert_sequential(subtitle_paths, results, **kwargs)
         elif operation == "realign":
@@ -185,13 +224,19 @@ class BatchProcessor:
         }
     
     def _process_convert_parallel(self, subtitle_paths: List[Path], 
-                                 results: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+                                 results: Dict[str, Any],
+                                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                                 **kwargs) -> Dict[str, Any]:
         """
         Process encoding conversion in parallel.
         
+        Uses worker processes when use_processes is set, threads otherwise.
+        Results are logged and counted here in the calling process either way.
+        
         Args:
             subtitle_paths: List of subtitle file paths
             results: Results dictionary to update
+            progress_callback: Optional callback function(done, total)
             **kwargs: Additional arguments for conversion
             
         Returns:
@@ -201,19 +246,36 @@ class BatchProcessor:
             """Convert a single file and return result."""
             try:
                 modified = self.converter.convert_file(file_path, **kwargs)
-                return file_path, modified, None
+                return file_path, bool(modified), None
             except Exception as e:
                 return file_path, False, str(e)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        if self.use_processes:
+            # Always spawn: forking a multithreaded caller (the GUI runs this
+            # from a worker thread) copies locks held by other threads and
+            # the parent's log handlers into every child
+            executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                           mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=_init_worker_process)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        with executor:
             # Submit all tasks
-            future_to_path = {
-                executor.submit(convert_file, path): path 
-                for path in subtitle_paths
-            }
+            if self.use_processes:
+                future_to_path = {
+                    executor.submit(_convert_in_process, path, kwargs): path
+                    for path in subtitle_paths
+                }
+            else:
+                future_to_path = {
+                    executor.submit(convert_file, path): path 
+                    for path in subtitle_paths
+                }
             
             # Process completed tasks
-            for future in as_completed(future_to_path):
+            total = len(future_to_path)
+            for done, future in enumerate(as_completed(future_to_path), 1):
                 file_path, modified, error = future.result()
                 
                 if error:
@@ -228,6 +290,9 @@ class BatchProcessor:
                 else:
                     results['unchanged'] += 1
                     logger.debug(f"- Unchanged: {file_path.name}")
+                
+                if progress_callback:
+                    progress_callback(done, total)
         
         return results
     
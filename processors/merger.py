@@ -31,7 +31,8 @@ class BilingualMerger:
                  force_pgs: bool = False, no_pgs: bool = False,
                  enable_mixed_realignment: bool = False,
                  top_language: str = 'first',
-                 progress_callback: Optional[Callable[[str, int, int], None]] = None):
+                 progress_callback: Optional[Callable[[str, int, int], None]] = None,
+                 translation_service: Optional[GoogleTranslationService] = None):
         """
         Initialize the bilingual merger.
 
@@ -49,6 +50,8 @@ class BilingualMerger:
             enable_mixed_realignment: Enable enhanced realignment for mixed embedded+external tracks
             top_language: Which subtitle appears on top ('first', 'second') - first is the primary/foreign language
             progress_callback: Optional callback function(step_name, current, total) for progress updates
+            translation_service: Already-initialized translation service to use when
+                use_translation is set, instead of creating and connection-testing a new one
         """
         # Validate alignment threshold
         if not 0.0 <= alignment_threshold <= 1.0:
@@ -85,7 +88,7 @@ class BilingualMerger:
         self._manual_selection_info = None  # Store manual selection details
 
         if use_translation:
-            self.translation_service = get_translation_service(translation_api_key)
+            self.translation_service = translation_service or get_translation_service(translation_api_key)
             if not self.translation_service:
                 logger.warning("Translation service not available. Falling back to similarity-only alignment.")
                 self.use_translation = False
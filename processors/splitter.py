@@ -18,6 +18,63 @@ from utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def classify_line(line: str) -> str:
+    """
+    Classify a text line as CJK, Latin, or ambiguous.
+
+    A line is CJK when it has at least as many CJK as Latin characters.
+
+    Args:
+        line: Text line to classify
+
+    Returns:
+        'cjk' for Chinese/Japanese/Korean text,
+        'latin' for English/Latin text,
+        'other' for ambiguous content
+    """
+    cjk_count = 0
+    latin_count = 0
+
+    for char in line:
+        cp = ord(char)
+        # CJK Unified Ideographs
+        if 0x4E00 <= cp <= 0x9FFF:
+            cjk_count += 1
+        # CJK Extension A
+        elif 0x3400 <= cp <= 0x4DBF:
+            cjk_count += 1
+        # CJK Extension B and beyond
+        elif 0x20000 <= cp <= 0x2CEAF:
+            cjk_count += 1
+        # CJK Compatibility Ideographs
+        elif 0xF900 <= cp <= 0xFAFF:
+            cjk_count += 1
+        # Hiragana
+        elif 0x3040 <= cp <= 0x309F:
+            cjk_count += 1
+        # Katakana
+        elif 0x30A0 <= cp <= 0x30FF:
+            cjk_count += 1
+        # Hangul
+        elif 0xAC00 <= cp <= 0xD7AF:
+            cjk_count += 1
+        # CJK punctuation (fullwidth forms, CJK symbols)
+        elif 0x3000 <= cp <= 0x303F:
+            cjk_count += 1
+        elif 0xFF00 <= cp <= 0xFFEF:
+            cjk_count += 1
+        # Latin letters
+        elif char.isalpha() and cp < 0x0250:
+            latin_count += 1
+
+    if cjk_count > 0 and cjk_count >= latin_count:
+        return 'cjk'
+    elif latin_count > 0:
+        return 'latin'
+    else:
+        return 'other'
+
+
 class BilingualSplitter:
     """Splits bilingual subtitle files into separate language files."""
 
@@ -160,7 +217,7 @@ class BilingualSplitter:
                 if not clean_line.strip():
                     continue
 
-                lang = self._classify_line(clean_line)
+                lang = classify_line(clean_line)
                 if lang == 'cjk':
                     lang1_lines.append(clean_line)
                 elif lang == 'latin':
@@ -187,60 +244,6 @@ class BilingualSplitter:
 
         return lang1_events, lang2_events
 
-    def _classify_line(self, line: str) -> str:
-        """
-        Classify a text line as CJK, Latin, or ambiguous.
-
-        Args:
-            line: Text line to classify
-
-        Returns:
-            'cjk' for Chinese/Japanese/Korean text,
-            'latin' for English/Latin text,
-            'other' for ambiguous content
-        """
-        cjk_count = 0
-        latin_count = 0
-
-        for char in line:
-            cp = ord(char)
-            # CJK Unified Ideographs
-            if 0x4E00 <= cp <= 0x9FFF:
-                cjk_count += 1
-            # CJK Extension A
-            elif 0x3400 <= cp <= 0x4DBF:
-                cjk_count += 1
-            # CJK Extension B and beyond
-            elif 0x20000 <= cp <= 0x2CEAF:
-                cjk_count += 1
-            # CJK Compatibility Ideographs
-            elif 0xF900 <= cp <= 0xFAFF:
-                cjk_count += 1
-            # Hiragana
-            elif 0x3040 <= cp <= 0x309F:
-                cjk_count += 1
-            # Katakana
-            elif 0x30A0 <= cp <= 0x30FF:
-                cjk_count += 1
-            # Hangul
-            elif 0xAC00 <= cp <= 0xD7AF:
-                cjk_count += 1
-            # CJK punctuation (fullwidth forms, CJK symbols)
-            elif 0x3000 <= cp <= 0x303F:
-                cjk_count += 1
-            elif 0xFF00 <= cp <= 0xFFEF:
-                cjk_count += 1
-            # Latin letters
-            elif char.isalpha() and cp < 0x0250:
-                latin_count += 1
-
-        if cjk_count > 0 and cjk_count >= latin_count:
-            return 'cjk'
-        elif latin_count > 0:
-            return 'latin'
-        else:
-            return 'other'
-
     def _strip_html_tags(self, text: str) -> str:
         """
         Strip HTML formatting tags from subtitle text.
@@ -317,7 +320,7 @@ class BilingualSplitter:
                 line = line.strip()
                 if not line:
                     continue
-                lang = self._classify_line(line)
+                lang = classify_line(line)
                 if lang == 'cjk':
                     has_cjk = True
                 elif lang == 'latin':
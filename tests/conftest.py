@@ -0,0 +1,8 @@
+"""Shared pytest setup: make the project packages importable."""
+
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
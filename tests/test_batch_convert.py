@@ -0,0 +1,48 @@
+"""Batch encoding conversion through the GUI's process-pool path."""
+
+import logging
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+from ui.gui import BATCH_PROCESS_MIN_FILES, LogHandler, _convert_batch_processor
+
+SRT_TEXT = "1\n00:00:01,000 --> 00:00:02,000\n你好，世界。这是一个测试字幕。\n\n"
+
+
+def test_large_batch_converts_in_spawned_processes(tmp_path):
+    files = []
+    for i in range(BATCH_PROCESS_MIN_FILES):
+        path = tmp_path / f"sub{i:02d}.srt"
+        path.write_bytes((SRT_TEXT * 20).encode("gb18030"))
+        files.append(path)
+
+    processor = _convert_batch_processor(len(files), auto_confirm=True)
+    assert processor.use_processes
+
+    # Stand in for the GUI's handler; workers must not need it
+    records = []
+    handler = LogHandler(records)
+    root = logging.getLogger()
+    root.addHandler(handler)
+    progress = []
+    try:
+        results = processor.process_subtitles_batch(
+            subtitle_paths=files,
+            operation="convert",
+            progress_callback=lambda done, total: progress.append((done, total)),
+            keep_backup=False,
+        )
+    finally:
+        root.removeHandler(handler)
+
+    assert results['failed'] == 0, results['errors']
+    assert results['successful'] == len(files)
+    assert progress[-1] == (len(files), len(files))
+    for path in files:
+        assert path.read_text(encoding="utf-8").startswith("1\n")
+
+
+def test_small_batch_uses_threads():
+    assert not _convert_batch_processor(BATCH_PROCESS_MIN_FILES - 1, auto_confirm=True).use_processes
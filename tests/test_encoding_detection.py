@@ -0,0 +1,25 @@
+"""Tests for EncodingDetector's sampled detection shortcuts."""
+
+import pytest
+
+from core.encoding_detection import EncodingDetector
+
+
+@pytest.mark.parametrize('encoding, expected', [
+    ('utf-8-sig', 'utf-8-sig'),
+    ('utf-16', 'utf-16'),
+    ('utf-32', 'utf-32'),
+])
+@pytest.mark.parametrize('max_bytes', [None, 65536])
+def test_byte_order_mark_settles_encoding(tmp_path, encoding, expected, max_bytes):
+    path = tmp_path / 'sub.srt'
+    path.write_text('1\n00:00:01,000 --> 00:00:02,000\n你好 hello\n', encoding=encoding)
+
+    assert EncodingDetector.detect_encoding(path, max_bytes=max_bytes) == expected
+
+
+def test_small_ascii_file_needs_no_detector(tmp_path):
+    path = tmp_path / 'sub.srt'
+    path.write_bytes(b'1\n00:00:01,000 --> 00:00:02,000\nhello\n')
+
+    assert EncodingDetector.detect_encoding(path, max_bytes=65536) == 'ascii'
@@ -0,0 +1,26 @@
+"""Directory scanning in FileHandler."""
+
+from utils.file_operations import FileHandler
+
+SRT_TEXT = "1\n00:00:01,000 --> 00:00:02,000\nHello there\n\n"
+
+
+def test_hidden_directories_are_skipped(tmp_path):
+    (tmp_path / "visible").mkdir()
+    (tmp_path / "visible" / "a.srt").write_text(SRT_TEXT)
+    for hidden in (".git", ".cfg.d"):
+        (tmp_path / hidden).mkdir()
+        (tmp_path / hidden / "z.srt").write_text(SRT_TEXT)
+
+    found = FileHandler.find_subtitle_files(tmp_path, recursive=True)
+
+    assert [p.name for p in found] == ["a.srt"]
+
+
+def test_directory_named_like_a_subtitle_is_descended(tmp_path):
+    (tmp_path / "season.srt").mkdir()
+    (tmp_path / "season.srt" / "e01.srt").write_text(SRT_TEXT)
+
+    found = FileHandler.find_subtitle_files(tmp_path, recursive=True)
+
+    assert [p.name for p in found] == ["e01.srt"]
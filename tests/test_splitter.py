@@ -0,0 +1,16 @@
+"""Tests for the CJK/Latin line classification shared with the GUI."""
+
+import pytest
+
+from processors.splitter import classify_line
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('你好，世界', 'cjk'),
+    ('Hello there', 'latin'),
+    ('OK 好的', 'cjk'),
+    ('Hello 你', 'latin'),
+    ('12:34 - !', 'other'),
+])
+def test_classify_line(line, expected):
+    assert classify_line(line) == expected
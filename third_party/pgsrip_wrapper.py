@@ -22,8 +22,10 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory for imports, unless the importer already has it
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in (os.path.abspath(p or os.curdir) for p in sys.path):
+    sys.path.insert(0, _PROJECT_ROOT)
 from core.video_containers import VideoContainerHandler
 from core.subtitle_formats import SubtitleTrack
 from utils.logging_config import get_logger
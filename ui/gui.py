@@ -14,16 +14,29 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+import tkinter.font as tkfont
 import queue
+import atexit
+import concurrent.futures
+import functools
+import importlib
+import io
+import subprocess
 import sys
 import os
+import threading
+import re
 from pathlib import Path
 from typing import Optional, List, Callable, Tuple
 import logging
+import time
+from collections import OrderedDict, deque
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports when run as a script; biss.py and
+# "python -m ui.gui" already have it, and a duplicate entry only adds lookups
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in (os.path.abspath(p or os.curdir) for p in sys.path):
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from utils.constants import APP_NAME, APP_VERSION, VIDEO_EXTENSIONS, SUBTITLE_EXTENSIONS, is_lite_build
 from utils.logging_config import get_logger
@@ -38,17 +51,364 @@ try:
 except ImportError:
     HAS_PIL = False
 
+# Initial main window size (width, height)
+WINDOW_SIZE = (950, 750)
+
+# Number of mkvinfo track listings kept in memory for re-opened videos
+TRACK_CACHE_SIZE = 16
+
+# Extract all selected tracks with one mkvextract call. mkvextract reads the
+# whole container on every run, so the per-track fallback (one call per
+# track) re-reads it once per track; it is kept for troubleshooting.
+BATCHED_TRACK_EXTRACTION = True
+
+# Worker threads shared by all background GUI operations
+BACKGROUND_WORKERS = 4
+
+# Delay before a file path typed into an entry is inspected
+TRACE_DEBOUNCE_MS = 300
+
+# Minimum seconds between merge progress redraws (~30 fps)
+PROGRESS_MIN_INTERVAL = 0.033
+
+# Intervals for draining the log and batch progress queues (see
+# _poll_log_queue). The poll backs off to the idle interval after
+# QUEUE_IDLE_TICKS ticks with nothing queued.
+QUEUE_POLL_MS = 30
+QUEUE_IDLE_POLL_MS = 250
+QUEUE_IDLE_TICKS = 5
+
+# Bytes read from an SRT file by the quick bilingual check
+BILINGUAL_SNIFF_BYTES = 65536
+
+# processors.splitter, imported on the first quick bilingual check
+_splitter_module = None
+
+# Log records waiting for the pane; older ones are dropped beyond this
+LOG_QUEUE_SIZE = 2000
+
+# The log pane keeps at most LOG_MAX_LINES, trimming LOG_TRIM_LINES at a time
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 1000
+
+# Batch conversions of at least this many files use worker processes
+BATCH_PROCESS_MIN_FILES = 32
+
+# Events shown in the subtitle preview window
+PREVIEW_MAX_EVENTS = 50
+
+# Info panels don't parse files larger than this to count events
+INFO_PARSE_MAX_BYTES = 50 * 1024 * 1024
+
+# File dialog filters shared by the browse buttons
+_SUB_FILETYPES = (("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*"))
+_SRT_FILETYPES = (("SRT files", "*.srt"), ("ASS files", "*.ass"), ("All files", "*.*"))
+_VIDEO_FILETYPES = (("Video files", "*.mkv *.mp4 *.avi *.mov *.webm *.ts"), ("All files", "*.*"))
+
+# Named Tk fonts created once in _configure_styles: name -> (family, size, style).
+# Styles and widgets refer to them by name, so Tk resolves each font once.
+_NAMED_FONTS = {
+    'BissHeader': ('Segoe UI', 11, 'normal'),
+    'BissTitle': ('Segoe UI', 14, 'bold'),
+    'BissSubtitle': ('Segoe UI', 9, 'normal'),
+    'BissAction': ('Segoe UI', 10, 'bold'),
+    'BissBig': ('Segoe UI', 11, 'normal'),
+    'BissLabel': ('TkDefaultFont', 9, 'normal'),
+    'BissLabelBold': ('TkDefaultFont', 9, 'bold'),
+    'BissHeading': ('TkDefaultFont', 10, 'bold'),
+    'BissHint': ('TkDefaultFont', 8, 'normal'),
+    'BissStatus': ('TkDefaultFont', 9, 'italic'),
+    'BissMono': ('Consolas', 9, 'normal'),
+    'BissPreviewMono': ('Consolas', 10, 'normal'),
+}
+
+# Rows shown by SubtitleInfoPanel: (key, label)
+_INFO_ITEMS = (
+    ("file", "File:"),
+    ("events", "Events:"),
+    ("duration", "Duration:"),
+    ("language", "Language:"),
+    ("encoding", "Encoding:"),
+)
+
+# Display names for detected language codes; others are shown upper-cased
+_LANGUAGE_NAMES = {'zh': 'Chinese', 'en': 'English', 'ja': 'Japanese', 'ko': 'Korean'}
+
+# Static choices for option widgets
+_OUTPUT_FORMATS = ('srt', 'ass')
+_QUICK_OFFSETS = ("-5s", "-1s", "-0.5s", "+0.5s", "+1s", "+5s")
+_TARGET_ENCODINGS = ('utf-8', 'utf-8-sig', 'gb18030', 'gbk', 'big5', 'shift-jis')
+
+# Convert tab: conversion type -> (dialog title, filters); others use _SUB_FILETYPES
+_CONVERT_BROWSE = {
+    'pgs_ocr': ("Select Video or Subtitle File", (
+        ("Video & SUP files", "*.mkv *.mp4 *.m4v *.mov *.avi *.ts *.sup"),
+        ("SUP files", "*.sup"),
+        ("Video files", "*.mkv *.mp4 *.m4v *.mov *.avi *.ts *.webm"),
+        ("VobSub files", "*.idx *.sub"),
+        ("All files", "*.*"),
+    )),
+    'sync': ("Select External Subtitle File", (
+        ("SRT files", "*.srt"), ("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*"),
+    )),
+}
+
+# Progress line printed by mkvextract --gui-mode
+_MKV_PROGRESS_RE = re.compile(r'#GUI#progress (\d+)%')
+
+# Track language tags treated as CJK / English when auto-selecting merge tracks
+_CJK_TRACK_LANG_RE = re.compile(r'chi|zh|cn|jpn|ja|kor|ko')
+_EN_TRACK_LANG_RE = re.compile(r'en')
+
+# mkvinfo track properties, matched against the line after its "|  " prefix
+_MKV_TRACK_NUMBER_RE = re.compile(r'\+ Track number: \d+ \(track ID for mkvmerge & mkvextract: (\d+)\)')
+_MKV_LANGUAGE_BCP47_RE = re.compile(r'\+ Language \(IETF BCP 47\): (\S+)')
+_MKV_LANGUAGE_RE = re.compile(r'\+ Language: (\S+)')
+_MKV_CODEC_RE = re.compile(r'\+ Codec ID: (\S+)')
+_MKV_NAME_RE = re.compile(r'\+ Name: (.+)')
+
+# Seconds a file-existence check from an entry callback is trusted
+EXISTS_CACHE_TTL = 2.0
+
+# Bytes sampled from the start of a subtitle file to guess its encoding
+ENCODING_SNIFF_BYTES = 65536
+# Extra arguments for MKVToolNix subprocesses: no stdin, and no console
+# window flashing up on Windows
+_SUBPROCESS_KWARGS = {'stdin': subprocess.DEVNULL}
+if sys.platform == 'win32':
+    _SUBPROCESS_KWARGS['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+# Modules imported lazily by background jobs, preloaded at startup (see _warm_imports)
+_WARM_IMPORT_MODULES = (
+    'core.ass_converter',
+    'core.encoding_detection',
+    'core.language_detection',
+    'core.subtitle_formats',
+    'core.video_containers',
+    'processors.batch_processor',
+    'processors.converter',
+    'processors.merger',
+    'processors.splitter',
+    'processors.subtitle_sync',
+    'processors.timing_adjuster',
+    'utils.file_operations',
+)
+
+
+def _quick_bilingual_sniff(path: Path) -> Optional[bool]:
+    """
+    Guess whether an SRT file is bilingual from its first 64 KB.
+
+    Returns True or False when the head of the file settles the question, or
+    None when the full BilingualSplitter check is needed (other formats,
+    non-UTF-8 encodings, or a large file with no CJK/Latin pair in the head).
+    """
+    if path.suffix.lower() != '.srt':
+        return None
+
+    with open(path, 'rb') as f:
+        head = f.read(BILINGUAL_SNIFF_BYTES)
+
+    try:
+        text = head.decode('utf-8-sig')
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off by the read limit is fine; anything
+        # else is a legacy encoding that needs proper detection
+        if len(head) < BILINGUAL_SNIFF_BYTES or e.start < len(head) - 3:
+            return None
+        text = head[:e.start].decode('utf-8-sig')
+
+    # Classify lines exactly as BilingualSplitter does, so the sniff never
+    # disagrees with the full check
+    global _splitter_module
+    if _splitter_module is None:
+        from processors import splitter as _splitter_module
+    classify = _splitter_module.classify_line
+    has_cjk = False
+    has_latin = False
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or '-->' in line:
+            continue
+        lang = classify(line)
+        if lang == 'cjk':
+            has_cjk = True
+        elif lang == 'latin':
+            has_latin = True
+        if has_cjk and has_latin:
+            return True
+
+    # The whole file was scanned without finding both scripts
+    if len(head) < BILINGUAL_SNIFF_BYTES:
+        return False
+    return None
+
+
+def _format_preview_time(seconds: float) -> str:
+    """Format seconds as HH:MM:SS.mmm for the preview window."""
+    secs, ms = divmod(round(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:03d}"
+
+
+@functools.lru_cache(maxsize=256)
+def _sniff_encoding_cached(path_str: str, mtime_ns: int, size: int) -> Optional[str]:
+    """
+    Detect a subtitle file's encoding from its first 64 KB; mtime_ns and size
+    key out stale results.
+    """
+    from core.encoding_detection import EncodingDetector
+    return EncodingDetector.detect_encoding(Path(path_str), max_bytes=ENCODING_SNIFF_BYTES)
+
+
+def _file_encoding(path) -> Optional[str]:
+    """Detect a file's encoding, reusing the result while the file is unchanged."""
+    st = os.stat(path)
+    return _sniff_encoding_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _private_cache_dir() -> Optional[Path]:
+    """
+    Return the per-user cache directory, creating it readable by the owner only.
+
+    Uses %LOCALAPPDATA% on Windows and $XDG_CACHE_HOME (or ~/.cache) elsewhere.
+    Returns None when the directory can't be created or is not private to us.
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or str(Path.home() / 'AppData' / 'Local')
+        cache_dir = Path(base) / 'BISS' / 'cache'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+        cache_dir = Path(base) / 'biss'
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if sys.platform != 'win32':
+            st = cache_dir.stat()
+            if st.st_uid != os.getuid():
+                return None
+            if st.st_mode & 0o077:
+                os.chmod(cache_dir, 0o700)
+    except OSError as e:
+        logger.debug(f"Cache directory unavailable: {e}")
+        return None
+    return cache_dir
+
+
+def _convert_batch_processor(total: int, auto_confirm: bool):
+    """
+    Create the BatchProcessor for a batch encoding conversion of total files.
+
+    Encoding detection is CPU-bound, so large batches use (spawned) worker
+    processes; small ones aren't worth their startup cost and run on threads.
+    """
+    from processors.batch_processor import BatchProcessor
+    cpus = os.cpu_count() or 2
+    if total >= BATCH_PROCESS_MIN_FILES:
+        return BatchProcessor(max_workers=cpus, auto_confirm=auto_confirm, use_processes=True)
+    return BatchProcessor(max_workers=min(16, cpus * 2), auto_confirm=auto_confirm)
+
+
+def _warm_imports():
+    """Import the modules the background jobs load on first use."""
+    for name in _WARM_IMPORT_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.debug(f"Warm import of {name} failed: {e}")
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_language_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Detect a subtitle file's language; mtime_ns and size key out stale results."""
+    from core.language_detection import LanguageDetector
+    lang = LanguageDetector.detect_language_from_filename(path_str)
+    if lang == 'unknown':
+        lang = LanguageDetector.detect_subtitle_language(Path(path_str))
+    return lang
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_subtitle(path_str: str, mtime_ns: int, size: int) -> Tuple:
+    """
+    Gather what SubtitleInfoPanel shows for a file; mtime_ns and size key
+    out stale results.
+
+    Returns:
+        Tuple of (encoding, language, event_count, duration_sec). encoding is
+        None if it could not be detected; event_count is None if the file
+        failed to parse or is larger than INFO_PARSE_MAX_BYTES, and
+        duration_sec is None when there are no events.
+    """
+    from core.subtitle_formats import SubtitleFormatFactory
+    path = Path(path_str)
+
+    try:
+        encoding = _sniff_encoding_cached(path_str, mtime_ns, size)
+    except (IOError, OSError, ValueError, TypeError):
+        encoding = None
+
+    lang = _detect_language_cached(path_str, mtime_ns, size)
+
+    if size > INFO_PARSE_MAX_BYTES:
+        return encoding, lang, None, None
+
+    try:
+        sub_file = SubtitleFormatFactory.parse_file(path)
+        n_events = len(sub_file.events)
+        duration_sec = sub_file.events[-1].end if sub_file.events else None
+    except (IOError, OSError, ValueError, UnicodeDecodeError):
+        n_events = None
+        duration_sec = None
+
+    return encoding, lang, n_events, duration_sec
+
+
+# Probes submitted but not finished yet, keyed like _probe_subtitle, so a
+# prewarm and the info panel asking for the same file share one parse
+_probe_inflight = {}
+_probe_inflight_lock = threading.Lock()
+
+
+def _submit_probe(executor: concurrent.futures.Executor,
+                  key: Tuple[str, int, int]) -> concurrent.futures.Future:
+    """
+    Probe a file on executor, or return the future of a probe of the same
+    (path, mtime_ns, size) that is already running.
+    """
+    with _probe_inflight_lock:
+        future = _probe_inflight.get(key)
+        if future is not None:
+            return future
+        future = executor.submit(SubtitleInfoPanel._probe, key)
+        _probe_inflight[key] = future
+
+    def forget(done):
+        with _probe_inflight_lock:
+            if _probe_inflight.get(key) is done:
+                del _probe_inflight[key]
+
+    future.add_done_callback(forget)
+    return future
+
 
 class LogHandler(logging.Handler):
     """Custom logging handler that sends logs to a queue for GUI display."""
 
-    def __init__(self, log_queue: queue.Queue):
+    def __init__(self, log_queue: deque, activity: Optional[threading.Event] = None):
         super().__init__()
         self.log_queue = log_queue
+        self.activity = activity
 
     def emit(self, record):
+        # Runs under the handler lock on any thread, so it must never call
+        # into Tk: a worker blocked on the Tk thread while the Tk thread
+        # waits for this lock would hang the GUI. Jobs call _wake_queue_drain
+        # outside the lock; the poll loop is the fallback.
         msg = self.format(record)
-        self.log_queue.put(msg)
+        self.log_queue.append(msg)
+        if self.activity is not None:
+            self.activity.set()
 
 
 class DragDropMixin:
@@ -68,77 +428,116 @@ class DragDropMixin:
 class SubtitleInfoPanel(ttk.LabelFrame):
     """Panel showing subtitle file information."""
 
-    def __init__(self, parent, title="Subtitle Info"):
+    def __init__(self, parent, title="Subtitle Info",
+                 executor: Optional[concurrent.futures.Executor] = None):
+        """
+        Args:
+            parent: Parent widget
+            title: Frame caption
+            executor: If given, files are probed on it instead of the Tk thread
+        """
         super().__init__(parent, text=title, padding="5")
 
         self.info_labels = {}
+        self._executor = executor
 
-        # Create info rows
-        info_items = [
-            ("file", "File:"),
-            ("events", "Events:"),
-            ("duration", "Duration:"),
-            ("language", "Language:"),
-            ("encoding", "Encoding:"),
-        ]
+        # (path, mtime_ns, size) of the file currently displayed
+        self._last_key = None
 
-        for i, (key, label) in enumerate(info_items):
-            ttk.Label(self, text=label, font=('TkDefaultFont', 9, 'bold')).grid(
+        # Create info rows
+        for i, (key, label) in enumerate(_INFO_ITEMS):
+            ttk.Label(self, text=label, font='BissLabelBold').grid(
                 row=i, column=0, sticky='w', padx=(0, 10))
-            self.info_labels[key] = ttk.Label(self, text="-", font=('TkDefaultFont', 9))
+            self.info_labels[key] = ttk.Label(self, text="-", font='BissLabel')
             self.info_labels[key].grid(row=i, column=1, sticky='w')
 
     def update_info(self, file_path: Optional[Path] = None):
         """Update info display for a subtitle file."""
-        if not file_path or not file_path.exists():
+        try:
+            st = file_path.stat() if file_path else None
+        except OSError:
+            st = None
+
+        if st is None:
+            self._last_key = None
             for label in self.info_labels.values():
                 label.config(text="-")
             return
 
-        try:
-            from core.subtitle_formats import SubtitleFormatFactory
-            from core.language_detection import LanguageDetector
-            from core.encoding_detection import EncodingDetector
+        # Skip re-reading a file that is already displayed and unchanged
+        key = (str(file_path), st.st_mtime_ns, st.st_size)
+        if key == self._last_key:
+            return
+        self._last_key = key
 
-            # Get file info
-            self.info_labels["file"].config(text=file_path.name[:40] + "..." if len(file_path.name) > 40 else file_path.name)
+        # Get file info
+        self.info_labels["file"].config(text=file_path.name[:40] + "..." if len(file_path.name) > 40 else file_path.name)
 
-            # Detect encoding
-            try:
-                encoding = EncodingDetector.detect_encoding(file_path)
-                if encoding:
-                    self.info_labels["encoding"].config(text=encoding.upper())
-                else:
-                    self.info_labels["encoding"].config(text="Unknown")
-            except (IOError, OSError, ValueError, TypeError):
-                self.info_labels["encoding"].config(text="Unknown")
-
-            # Detect language
-            lang = LanguageDetector.detect_language_from_filename(str(file_path))
-            if lang == 'unknown':
-                lang = LanguageDetector.detect_subtitle_language(file_path)
-            lang_display = {'zh': 'Chinese', 'en': 'English', 'ja': 'Japanese', 'ko': 'Korean'}.get(lang, lang.upper())
-            self.info_labels["language"].config(text=lang_display)
-
-            # Parse subtitle
+        # Nothing to detect in an empty file
+        if st.st_size == 0:
+            for name in ("duration", "language", "encoding"):
+                self.info_labels[name].config(text="-")
+            self.info_labels["events"].config(text="0")
+            return
+
+        if self._executor is None:
+            self._show_probe(key, self._probe(key))
+            return
+
+        for name in ("events", "duration", "language", "encoding"):
+            self.info_labels[name].config(text="...")
+
+        def show(future):
+            # Runs on the worker, or right here if the probe already finished
             try:
-                sub_file = SubtitleFormatFactory.parse_file(file_path)
-                self.info_labels["events"].config(text=str(len(sub_file.events)))
-
-                if sub_file.events:
-                    duration_sec = sub_file.events[-1].end
-                    hours = int(duration_sec // 3600)
-                    minutes = int((duration_sec % 3600) // 60)
-                    seconds = int(duration_sec % 60)
-                    self.info_labels["duration"].config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-                else:
-                    self.info_labels["duration"].config(text="-")
-            except (IOError, OSError, ValueError, UnicodeDecodeError):
-                self.info_labels["events"].config(text="Error")
-                self.info_labels["duration"].config(text="-")
+                self.after(0, self._show_probe, key, future.result())
+            except (RuntimeError, tk.TclError):
+                # Window already destroyed
+                pass
 
+        _submit_probe(self._executor, key).add_done_callback(show)
+
+    @staticmethod
+    def _probe(key: Tuple[str, int, int]) -> Optional[Tuple]:
+        """Run _probe_subtitle, returning None if it fails."""
+        try:
+            return _probe_subtitle(*key)
         except Exception as e:
             logger.debug(f"Error getting subtitle info: {e}")
+            return None
+
+    def _show_probe(self, key: Tuple[str, int, int], info: Optional[Tuple]):
+        """Fill in the labels from a probe, unless another file is shown by now."""
+        if key != self._last_key:
+            return
+
+        if info is None:
+            for name in ("events", "duration", "language", "encoding"):
+                self.info_labels[name].config(text="-")
+            return
+
+        # Encoding, language and event stats come from one cached probe
+        encoding, lang, n_events, duration_sec = info
+
+        self.info_labels["encoding"].config(text=encoding.upper() if encoding else "Unknown")
+
+        lang_display = _LANGUAGE_NAMES.get(lang) or lang.upper()
+        self.info_labels["language"].config(text=lang_display)
+
+        if n_events is None:
+            too_large = key[2] > INFO_PARSE_MAX_BYTES
+            self.info_labels["events"].config(text="Not counted (large file)" if too_large else "Error")
+            self.info_labels["duration"].config(text="-")
+        else:
+            self.info_labels["events"].config(text=str(n_events))
+
+            if duration_sec is not None:
+                hours = int(duration_sec // 3600)
+                minutes = int((duration_sec % 3600) // 60)
+                seconds = int(duration_sec % 60)
+                self.info_labels["duration"].config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            else:
+                self.info_labels["duration"].config(text="-")
 
 
 class BISSGui:
@@ -147,7 +546,10 @@ class BISSGui:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title(f"{APP_NAME} v{APP_VERSION}")
-        self.root.geometry("950x750")
+        # Screen size doesn't change while running, so query it only once
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
+        self._center_window()
         self.root.minsize(850, 650)
 
         # Initialize PGSRip wrapper
@@ -162,12 +564,55 @@ class BISSGui:
         except Exception:
             pass
 
+        # Shared worker pool for every background operation
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=BACKGROUND_WORKERS, thread_name_prefix='gui-bg')
+
+        # MKVToolNix availability is probed once per session (see _check_mkvtoolnix_available)
+        self._mkvtoolnix_probe = None
+        # Translation service shared by merges, created on first use (see run_merge)
+        self._translation_service = None
+        # mkvinfo results keyed by (path, mtime_ns, size), most recent last;
+        # loads run on the executor, so access goes through the lock
+        self._extract_tracks_cache = OrderedDict()
+        self._extract_tracks_lock = threading.Lock()
+
+        # Pending debounced callbacks (see _debounce), keyed by name
+        self._debounce_jobs = {}
+
+        # BilingualSplitter instances keyed by strip_formatting (see _get_splitter)
+        self._splitter_cache = {}
+
+        # path -> (checked_at, exists) for entry callbacks (see _cached_exists)
+        self._exists_cache = {}
+
+        # When the merge progress bar was last redrawn (see _execute_merge)
+        self._last_progress_ts = 0.0
+
+        # Extracted preview files keyed by (video_path, track_id), removed at
+        # exit. Keys being extracted right now are in _preview_inflight; both
+        # are shared with executor threads under _preview_lock.
+        self._preview_cache = {}
+        self._preview_inflight = set()
+        self._preview_lock = threading.Lock()
+        atexit.register(self._cleanup_preview_files)
+
         # Configure style
         self.style = ttk.Style()
         self._configure_styles()
 
-        # Log queue for thread-safe logging
-        self.log_queue = queue.Queue()
+        # Log queue for thread-safe logging. Bounded: if the pane can't keep
+        # up, the oldest records are dropped rather than piling up in memory.
+        self.log_queue = deque(maxlen=LOG_QUEUE_SIZE)
+        # Set by workers when they queue log records or batch progress
+        self._queue_activity = threading.Event()
+        # Consecutive polls that found both queues empty (see _poll_log_queue)
+        self._idle_ticks = 0
+        # Set while a _wake_queue_drain call is waiting to run on the Tk thread
+        self._drain_wake_pending = threading.Event()
+
+        # Batch progress text from workers; only the newest entry is shown
+        self.batch_progress_queue = queue.SimpleQueue()
 
         # Configure logging to GUI
         self._setup_logging()
@@ -181,20 +626,26 @@ class BISSGui:
         # Start log polling
         self._poll_log_queue()
 
-        # Center window
-        self._center_window()
+        # Import the processing modules while the user is still picking files
+        self._executor.submit(_warm_imports)
 
     def _configure_styles(self):
         """Configure ttk styles for better appearance."""
-        self.style.configure('Header.TLabel', font=('Segoe UI', 11))
-        self.style.configure('Title.TLabel', font=('Segoe UI', 14, 'bold'))
-        self.style.configure('Subtitle.TLabel', font=('Segoe UI', 9), foreground='gray')
-        self.style.configure('Action.TButton', font=('Segoe UI', 10, 'bold'), padding=(20, 10))
-        self.style.configure('Big.TButton', font=('Segoe UI', 11), padding=(30, 15))
+        # Font objects delete their Tk font when collected, so keep them
+        self._fonts = {
+            name: tkfont.Font(root=self.root, name=name, font=spec)
+            for name, spec in _NAMED_FONTS.items()
+        }
+
+        self.style.configure('Header.TLabel', font='BissHeader')
+        self.style.configure('Title.TLabel', font='BissTitle')
+        self.style.configure('Subtitle.TLabel', font='BissSubtitle', foreground='gray')
+        self.style.configure('Action.TButton', font='BissAction', padding=(20, 10))
+        self.style.configure('Big.TButton', font='BissBig', padding=(30, 15))
 
     def _setup_logging(self):
         """Set up logging to display in GUI."""
-        self.log_handler = LogHandler(self.log_queue)
+        self.log_handler = LogHandler(self.log_queue, activity=self._queue_activity)
         self.log_handler.setFormatter(logging.Formatter('%(message)s'))
 
         # Add handler to root logger
@@ -203,12 +654,10 @@ class BISSGui:
         root_logger.setLevel(logging.INFO)
 
     def _center_window(self):
-        """Center the window on screen."""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        """Size the window and center it on screen in one geometry call."""
+        width, height = WINDOW_SIZE
+        x = (self._screen_w // 2) - (width // 2)
+        y = (self._screen_h // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
 
     def _create_header(self):
@@ -220,22 +669,15 @@ class BISSGui:
         self.logo_image = None
         logo_path = Path(__file__).parent.parent / "images" / "biss-logo.png"
 
-        if logo_path.exists() and HAS_PIL:
+        if logo_path.exists():
             try:
-                # Load and resize logo
-                img = Image.open(logo_path)
-                # Calculate new size maintaining aspect ratio
-                max_height = 60
-                ratio = max_height / img.height
-                new_width = int(img.width * ratio)
-                img = img.resize((new_width, max_height), Image.Resampling.LANCZOS)
-                self.logo_image = ImageTk.PhotoImage(img)
-
-                logo_label = ttk.Label(header_frame, image=self.logo_image)
-                logo_label.pack(side=tk.LEFT, padx=(0, 20))
+                self.logo_image = self._load_logo(logo_path, max_height=60)
             except Exception as e:
                 logger.debug(f"Could not load logo: {e}")
-                self._create_text_header(header_frame)
+
+        if self.logo_image is not None:
+            logo_label = ttk.Label(header_frame, image=self.logo_image)
+            logo_label.pack(side=tk.LEFT, padx=(0, 20))
         else:
             self._create_text_header(header_frame)
 
@@ -247,6 +689,57 @@ class BISSGui:
         ttk.Label(info_frame, text=t('app.tagline'),
                  style='Subtitle.TLabel').pack(anchor='e')
 
+    def _load_logo(self, logo_path: Path, max_height: int):
+        """
+        Load the logo scaled to max_height, keeping aspect ratio.
+
+        The scaled image is cached as a PNG in the per-user cache directory,
+        keyed by the source's mtime, so later launches hand it straight to
+        Tk's own PNG reader instead of decoding and resampling the original
+        with PIL.
+
+        Returns:
+            PhotoImage, or None if the logo can't be loaded
+        """
+        import tempfile
+        cache_dir = _private_cache_dir()
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = cache_dir / f"logo_{max_height}_{logo_path.stat().st_mtime_ns}.png"
+            if cache_path.exists():
+                try:
+                    return tk.PhotoImage(file=str(cache_path))
+                except tk.TclError as e:
+                    # Tk older than 8.6 can't read PNG, or the cache is damaged
+                    logger.debug(f"Could not load cached logo: {e}")
+
+        if not HAS_PIL:
+            return None
+
+        # draft() lets JPEG decoders downscale while decoding and thumbnail()
+        # works in place, so a large replacement logo is never decoded and
+        # resampled at full size.
+        size = (max_height * 10, max_height)
+        img = Image.open(logo_path)
+        img.draft('RGB', size)
+        img.thumbnail(size, Image.Resampling.BILINEAR)
+
+        # Write to a unique temporary file first so a concurrent launch never
+        # reads a half-written file
+        if cache_path is not None:
+            tmp_name = None
+            try:
+                fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    img.save(f, 'PNG')
+                os.replace(tmp_name, cache_path)
+            except OSError as e:
+                logger.debug(f"Could not cache logo: {e}")
+                if tmp_name:
+                    Path(tmp_name).unlink(missing_ok=True)
+
+        return ImageTk.PhotoImage(img)
+
     def _create_text_header(self, parent):
         """Create text-based header when logo unavailable."""
         title_frame = ttk.Frame(parent)
@@ -285,6 +778,8 @@ class BISSGui:
         tools_menu.add_command(label=t('gui.convert_encoding'), command=lambda: self.notebook.select(3))
         tools_menu.add_separator()
         tools_menu.add_command(label=t('gui.batch_operations'), command=lambda: self.notebook.select(4))
+        tools_menu.add_separator()
+        tools_menu.add_command(label=t('gui.recheck_mkvtoolnix'), command=self._recheck_mkvtoolnix)
 
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -302,22 +797,43 @@ class BISSGui:
 
         # Create notebook (tabbed interface)
         self.notebook = ttk.Notebook(main_frame)
-        self.notebook.pack(fill=tk.BOTH, expand=True)
 
-        # Create tabs (Merge first as primary function)
-        self._create_merge_tab()
-        self._create_extract_tab()
-        self._create_split_tab()
-        self._create_shift_tab()
-        self._create_convert_tab()
-        self._create_batch_tab()
+        # Create tabs (Merge first as primary function). Only empty frames are
+        # added here; each tab's widgets are built the first time it is shown.
+        tabs = [
+            ('merge', "  Merge Subtitles  ", self._create_merge_tab_body),
+            ('extract', "  Extract Tracks  ", self._create_extract_tab_body),
+            ('split', "  Split Bilingual  ", self._create_split_tab_body),
+            ('shift', "  Shift Timing  ", self._create_shift_tab_body),
+            ('convert', "  Convert  ", self._create_convert_tab_body),
+            ('batch', "  Batch Operations  ", self._create_batch_tab_body),
+        ]
+        self._tab_keys = [key for key, _, _ in tabs]
+        self._tab_frames = {}
+        self._tab_builders = {}
+        self._tab_built = {}
+        for key, text, builder in tabs:
+            frame = ttk.Frame(self.notebook, padding="10")
+            self.notebook.add(frame, text=text)
+            self._tab_frames[key] = frame
+            self._tab_builders[key] = builder
+            self._tab_built[key] = False
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+        # The merge tab is shown first and the menu commands fill its fields
+        self._build_tab('merge')
+
+        # Pack once the first tab's widgets exist, so the notebook is laid
+        # out with its final contents
+        self.notebook.pack(fill=tk.BOTH, expand=True)
 
         # Log output area
         log_frame = ttk.LabelFrame(main_frame, text=t('gui.output_log'), padding="5")
         log_frame.pack(fill=tk.X, pady=(10, 0))
 
         self.log_text = scrolledtext.ScrolledText(log_frame, height=6, state='disabled',
-                                                   font=('Consolas', 9), wrap=tk.WORD)
+                                                   font='BissMono', wrap=tk.WORD,
+                                                   undo=False, autoseparators=False, maxundo=0)
         self.log_text.pack(fill=tk.X, expand=True)
 
         # Log controls
@@ -325,11 +841,23 @@ class BISSGui:
         log_controls.pack(fill=tk.X, pady=(2, 0))
         ttk.Button(log_controls, text=t('gui.clear'), command=self._clear_log, width=8).pack(side=tk.RIGHT)
 
-    def _create_merge_tab(self):
-        """Create the Merge Subtitles tab - Primary function."""
-        tab = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(tab, text="  Merge Subtitles  ")
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's widgets the first time it is shown."""
+        try:
+            index = self.notebook.index('current')
+        except tk.TclError:
+            return
+        self._build_tab(self._tab_keys[index])
 
+    def _build_tab(self, key: str):
+        """Create a tab's widgets unless that has already been done."""
+        if self._tab_built[key]:
+            return
+        self._tab_built[key] = True
+        self._tab_builders[key](self._tab_frames[key])
+
+    def _create_merge_tab_body(self, tab):
+        """Create the Merge Subtitles tab - Primary function."""
         # Store reference
         self.merge_tab = tab
 
@@ -346,7 +874,7 @@ class BISSGui:
         v_row = ttk.Frame(video_frame)
         v_row.pack(fill=tk.X)
         self.merge_video_var = tk.StringVar()
-        self.merge_video_var.trace('w', lambda *args: self._on_video_changed())
+        self.merge_video_var.trace('w', lambda *args: self._debounce('video', self._on_video_changed))
         ttk.Entry(v_row, textvariable=self.merge_video_var, width=50).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(v_row, text="Browse...", command=self._browse_merge_video).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(v_row, text="Scan Tracks", command=self._scan_video_tracks).pack(side=tk.LEFT, padx=(5, 0))
@@ -360,6 +888,10 @@ class BISSGui:
         # Store scanned tracks
         self.scanned_tracks = []
         self.external_subs_found = []
+        # Embedded track summary for tracks_label, None until a scan finishes
+        self._tracks_summary = None
+        # Combobox label -> track ID for the scanned tracks
+        self._label_to_track_id = {}
 
         # Languages for auto-detect dropdown
         self.language_options = ['Any', 'Chinese', 'Japanese', 'Korean', 'English', 'Spanish', 'French', 'German', 'Other']
@@ -374,11 +906,11 @@ class BISSGui:
 
         self.chinese_source_var = tk.StringVar(value="auto")
         ttk.Radiobutton(t1_source_row, text="Auto-detect", variable=self.chinese_source_var,
-                       value="auto", command=self._update_chinese_source).pack(side=tk.LEFT)
+                       value="auto", command=lambda: self._update_source('chinese')).pack(side=tk.LEFT)
         ttk.Radiobutton(t1_source_row, text="Embedded track", variable=self.chinese_source_var,
-                       value="embedded", command=self._update_chinese_source).pack(side=tk.LEFT, padx=(15, 0))
+                       value="embedded", command=lambda: self._update_source('chinese')).pack(side=tk.LEFT, padx=(15, 0))
         ttk.Radiobutton(t1_source_row, text="External file", variable=self.chinese_source_var,
-                       value="external", command=self._update_chinese_source).pack(side=tk.LEFT, padx=(15, 0))
+                       value="external", command=lambda: self._update_source('chinese')).pack(side=tk.LEFT, padx=(15, 0))
 
         # Auto-detect language selector (shown when auto is selected)
         self.chinese_auto_frame = ttk.Frame(track1_frame)
@@ -403,12 +935,12 @@ class BISSGui:
         self.chinese_file_frame = ttk.Frame(track1_frame)
         ttk.Label(self.chinese_file_frame, text="File:").pack(side=tk.LEFT)
         self.chinese_file_var = tk.StringVar()
-        self.chinese_file_var.trace('w', lambda *args: self._on_chinese_file_changed())
+        self.chinese_file_var.trace('w', lambda *args: self._debounce('chinese', self._on_chinese_file_changed))
         ttk.Entry(self.chinese_file_frame, textvariable=self.chinese_file_var, width=40).pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
         ttk.Button(self.chinese_file_frame, text="Browse...", command=lambda: self._browse_sub_file('chinese')).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(self.chinese_file_frame, text="Preview",
                   command=lambda: self._show_subtitle_preview(self.chinese_file_var.get())).pack(side=tk.LEFT, padx=(5, 0))
-        self.chinese_lang_label = ttk.Label(self.chinese_file_frame, text="", foreground='#1E90FF', font=('TkDefaultFont', 9, 'bold'))
+        self.chinese_lang_label = ttk.Label(self.chinese_file_frame, text="", foreground='#1E90FF', font='BissLabelBold')
         self.chinese_lang_label.pack(side=tk.LEFT, padx=(5, 0))
 
         # === Track 2 (Bottom Subtitle) ===
@@ -421,11 +953,11 @@ class BISSGui:
 
         self.english_source_var = tk.StringVar(value="auto")
         ttk.Radiobutton(t2_source_row, text="Auto-detect", variable=self.english_source_var,
-                       value="auto", command=self._update_english_source).pack(side=tk.LEFT)
+                       value="auto", command=lambda: self._update_source('english')).pack(side=tk.LEFT)
         ttk.Radiobutton(t2_source_row, text="Embedded track", variable=self.english_source_var,
-                       value="embedded", command=self._update_english_source).pack(side=tk.LEFT, padx=(15, 0))
+                       value="embedded", command=lambda: self._update_source('english')).pack(side=tk.LEFT, padx=(15, 0))
         ttk.Radiobutton(t2_source_row, text="External file", variable=self.english_source_var,
-                       value="external", command=self._update_english_source).pack(side=tk.LEFT, padx=(15, 0))
+                       value="external", command=lambda: self._update_source('english')).pack(side=tk.LEFT, padx=(15, 0))
 
         # Auto-detect language selector (shown when auto is selected)
         self.english_auto_frame = ttk.Frame(track2_frame)
@@ -450,12 +982,12 @@ class BISSGui:
         self.english_file_frame = ttk.Frame(track2_frame)
         ttk.Label(self.english_file_frame, text="File:").pack(side=tk.LEFT)
         self.english_file_var = tk.StringVar()
-        self.english_file_var.trace('w', lambda *args: self._on_english_file_changed())
+        self.english_file_var.trace('w', lambda *args: self._debounce('english', self._on_english_file_changed))
         ttk.Entry(self.english_file_frame, textvariable=self.english_file_var, width=40).pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
         ttk.Button(self.english_file_frame, text="Browse...", command=lambda: self._browse_sub_file('english')).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(self.english_file_frame, text="Preview",
                   command=lambda: self._show_subtitle_preview(self.english_file_var.get())).pack(side=tk.LEFT, padx=(5, 0))
-        self.english_lang_label = ttk.Label(self.english_file_frame, text="", foreground='#1E90FF', font=('TkDefaultFont', 9, 'bold'))
+        self.english_lang_label = ttk.Label(self.english_file_frame, text="", foreground='#1E90FF', font='BissLabelBold')
         self.english_lang_label.pack(side=tk.LEFT, padx=(5, 0))
 
         # === Options Frame ===
@@ -494,7 +1026,7 @@ class BISSGui:
 
         ttk.Label(row2, text="Output format:").pack(side=tk.LEFT)
         self.merge_format_var = tk.StringVar(value="srt")
-        ttk.Combobox(row2, textvariable=self.merge_format_var, values=['srt', 'ass'],
+        ttk.Combobox(row2, textvariable=self.merge_format_var, values=_OUTPUT_FORMATS,
                     width=6, state='readonly').pack(side=tk.LEFT, padx=(5, 20))
 
         ttk.Label(row2, text="Alignment threshold:").pack(side=tk.LEFT)
@@ -527,15 +1059,22 @@ class BISSGui:
         self.merge_progress = ttk.Progressbar(btn_frame, mode='determinate', length=200, maximum=100)
         self.merge_progress_label = ttk.Label(btn_frame, text="", style='Subtitle.TLabel')
 
+        # Frame shown for each source mode, per track side (see _update_source)
+        self._source_frames = {
+            'chinese': {'auto': self.chinese_auto_frame, 'embedded': self.chinese_track_frame,
+                        'external': self.chinese_file_frame},
+            'english': {'auto': self.english_auto_frame, 'embedded': self.english_track_frame,
+                        'external': self.english_file_frame},
+        }
+        self._source_vars = {'chinese': self.chinese_source_var, 'english': self.english_source_var}
+        self._current_source_mode = {'chinese': None, 'english': None}
+
         # Initialize source displays
-        self._update_chinese_source()
-        self._update_english_source()
+        self._update_source('chinese')
+        self._update_source('english')
 
-    def _create_extract_tab(self):
+    def _create_extract_tab_body(self, tab):
         """Create the Extract Tracks tab for mkvextract."""
-        tab = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(tab, text="  Extract Tracks  ")
-
         # Intro
         ttk.Label(tab, text="Extract subtitle tracks from video files (MKV preferred, fast with mkvextract)",
                  style='Subtitle.TLabel').pack(anchor='w', pady=(0, 10))
@@ -612,9 +1151,15 @@ class BISSGui:
                                       command=self._execute_extract, style='Big.TButton')
         self.extract_btn.pack(side=tk.RIGHT)
 
-        # Progress indicator
-        self.extract_progress = ttk.Progressbar(btn_frame, mode='indeterminate', length=150)
+        # Progress indicator (driven by mkvextract --gui-mode output)
+        self.extract_progress = ttk.Progressbar(btn_frame, mode='determinate', length=150, maximum=100)
         self.extract_progress_label = ttk.Label(btn_frame, text="", style='Subtitle.TLabel')
+        self.extract_cancel_btn = ttk.Button(btn_frame, text="Cancel", command=self._cancel_extract)
+
+        # Running mkvextract process, so it can be cancelled
+        self._extract_proc = None
+        # Set by the Cancel button; checked before each mkvextract call
+        self._extract_cancel = threading.Event()
 
         # Store tracks data
         self._extract_tracks = []
@@ -638,21 +1183,38 @@ class BISSGui:
     def _check_mkvtoolnix_available(self) -> tuple:
         """Check if MKVToolNix tools are available.
 
+        The result is cached for the session; use Tools > Re-check MKVToolNix
+        to probe again after installing.
+
         Returns:
             (available, missing_tools) tuple
         """
-        import subprocess
+        if self._mkvtoolnix_probe is None:
+            self._mkvtoolnix_probe = self._probe_mkvtoolnix()
+        return self._mkvtoolnix_probe
+
+    def _probe_mkvtoolnix(self) -> tuple:
+        """Run each MKVToolNix tool with --version to see if it is installed."""
         missing = []
         for tool in ['mkvextract', 'mkvinfo']:
             try:
                 result = subprocess.run([tool, '--version'],
-                                       capture_output=True, timeout=5)
+                                       capture_output=True, timeout=5, **_SUBPROCESS_KWARGS)
                 if result.returncode != 0:
                     missing.append(tool)
             except (subprocess.SubprocessError, FileNotFoundError):
                 missing.append(tool)
         return (len(missing) == 0, missing)
 
+    def _recheck_mkvtoolnix(self):
+        """Discard the cached MKVToolNix probe and check again."""
+        self._mkvtoolnix_probe = None
+        available, missing = self._check_mkvtoolnix_available()
+        if available:
+            messagebox.showinfo("MKVToolNix", "MKVToolNix is installed and ready.")
+        else:
+            self._show_mkvtoolnix_missing_dialog()
+
     def _show_mkvtoolnix_missing_dialog(self):
         """Show dialog about missing MKVToolNix."""
         msg = """MKVToolNix is required for the Extract Tracks feature.
@@ -671,15 +1233,12 @@ Linux (Debian/Ubuntu):
 Linux (Fedora):
   sudo dnf install mkvtoolnix
 
-After installation, restart this application."""
+After installation, use Tools > Re-check MKVToolNix or restart this application."""
 
         messagebox.showerror("MKVToolNix Not Found", msg)
 
     def _load_extract_tracks(self):
         """Load tracks from MKV file using mkvinfo."""
-        import subprocess
-        import re
-
         # Check if MKVToolNix is available first
         available, missing = self._check_mkvtoolnix_available()
         if not available:
@@ -692,68 +1251,107 @@ After installation, restart this application."""
             return
 
         # Clear existing tracks
-        for item in self.extract_tree.get_children():
-            self.extract_tree.delete(item)
+        self.extract_tree.delete(*self.extract_tree.get_children())
         self._extract_tracks = []
 
         self._set_status("Loading tracks...")
 
+        # Update UI in main thread; all rows are inserted in one idle callback
+        # so the tree is laid out once rather than per track
+        def show_tracks(subtitle_tracks):
+            self._extract_tracks = subtitle_tracks
+            rows = [(track['id'], track['language'], track['codec'], track['name'])
+                    for track in subtitle_tracks]
+            insert = self.extract_tree.insert
+            for values in rows:
+                insert('', 'end', values=values)
+            self._set_status(f"Loaded {len(subtitle_tracks)} subtitle tracks")
+
         def load_tracks():
+            try:
+                st = os.stat(video_path)
+            except OSError:
+                self._ui(lambda: messagebox.showerror("Error", f"File not found: {video_path}"),
+                         lambda: self._set_status("Ready"))
+                return
+
+            # Re-opening an unchanged video reuses the previous mkvinfo listing
+            cache_key = (video_path, st.st_mtime_ns, st.st_size)
+            with self._extract_tracks_lock:
+                cached = self._extract_tracks_cache.get(cache_key)
+                if cached is not None:
+                    self._extract_tracks_cache.move_to_end(cache_key)
+            if cached is not None:
+                self.root.after_idle(show_tracks, cached)
+                return
+
             try:
                 # Run mkvinfo
                 result = subprocess.run(['mkvinfo', video_path],
-                                       capture_output=True, timeout=60)
-                output = result.stdout.decode('utf-8', errors='replace')
+                                       capture_output=True, timeout=60, **_SUBPROCESS_KWARGS)
+                # Decode lazily, line by line, instead of building the whole
+                # decoded string and a list of its lines
+                output = io.TextIOWrapper(io.BytesIO(result.stdout), encoding='utf-8', errors='replace')
 
                 tracks = []
                 current_track = None
 
-                for line in output.split('\n'):
-                    # Track number line
-                    match = re.search(r'Track number: \d+ \(track ID for mkvmerge & mkvextract: (\d+)\)', line)
-                    if match:
-                        if current_track:
-                            tracks.append(current_track)
-                        current_track = {
-                            'id': int(match.group(1)),
-                            'type': 'unknown',
-                            'language': '',
-                            'codec': '',
-                            'name': ''
-                        }
+                for line in output:
+                    # Track properties look like "|  + Codec ID: S_TEXT/UTF8";
+                    # dispatch on the first letters of the property name so
+                    # each line is scanned once
+                    body = line.lstrip('| ')
+                    if not body.startswith('+ '):
                         continue
+                    key = body[2:6]
 
-                    if current_track is None:
+                    if key == 'Trac':
+                        # Track number line
+                        match = _MKV_TRACK_NUMBER_RE.match(body)
+                        if match:
+                            if current_track:
+                                tracks.append(current_track)
+                            current_track = {
+                                'id': int(match.group(1)),
+                                'type': 'unknown',
+                                'language': '',
+                                'codec': '',
+                                'name': ''
+                            }
+                            continue
+
+                        # Track type
+                        if current_track is not None and body.startswith('+ Track type:'):
+                            track_type = body[13:].lower()
+                            if 'video' in track_type:
+                                current_track['type'] = 'video'
+                            elif 'audio' in track_type:
+                                current_track['type'] = 'audio'
+                            elif 'subtitle' in track_type:
+                                current_track['type'] = 'subtitles'
+
+                    elif current_track is None:
                         continue
 
-                    # Track type
-                    if 'Track type:' in line:
-                        if 'video' in line.lower():
-                            current_track['type'] = 'video'
-                        elif 'audio' in line.lower():
-                            current_track['type'] = 'audio'
-                        elif 'subtitle' in line.lower():
-                            current_track['type'] = 'subtitles'
-
                     # Language
-                    if 'Language (IETF BCP 47):' in line:
-                        match = re.search(r'Language \(IETF BCP 47\): (\S+)', line)
-                        if match:
-                            current_track['language'] = match.group(1)
-                    elif 'Language:' in line and not current_track['language']:
-                        match = re.search(r'Language: (\S+)', line)
+                    elif key == 'Lang':
+                        match = _MKV_LANGUAGE_BCP47_RE.match(body)
                         if match:
                             current_track['language'] = match.group(1)
+                        elif not current_track['language']:
+                            match = _MKV_LANGUAGE_RE.match(body)
+                            if match:
+                                current_track['language'] = match.group(1)
 
                     # Codec ID
-                    if 'Codec ID:' in line:
-                        match = re.search(r'Codec ID: (\S+)', line)
+                    elif key == 'Code':
+                        match = _MKV_CODEC_RE.match(body)
                         if match:
                             current_track['codec'] = match.group(1)
 
                     # Track name
-                    if '+ Name:' in line:
-                        match = re.search(r'\+ Name: (.+)', line)
+                    elif key == 'Name':
+                        match = _MKV_NAME_RE.match(body)
                         if match:
                             current_track['name'] = match.group(1).strip()
 
@@ -763,33 +1361,26 @@ After installation, restart this application."""
                 # Filter to subtitle tracks only
                 subtitle_tracks = [t for t in tracks if t['type'] == 'subtitles']
 
-                # Update UI in main thread
-                def update_ui():
-                    self._extract_tracks = subtitle_tracks
-                    for track in subtitle_tracks:
-                        self.extract_tree.insert('', 'end', values=(
-                            track['id'],
-                            track['language'],
-                            track['codec'],
-                            track['name']
-                        ))
-                    self._set_status(f"Loaded {len(subtitle_tracks)} subtitle tracks")
+                with self._extract_tracks_lock:
+                    self._extract_tracks_cache[cache_key] = subtitle_tracks
+                    if len(self._extract_tracks_cache) > TRACK_CACHE_SIZE:
+                        self._extract_tracks_cache.popitem(last=False)
 
-                self.root.after(0, update_ui)
+                self.root.after_idle(show_tracks, subtitle_tracks)
 
             except FileNotFoundError:
-                self.root.after(0, self._show_mkvtoolnix_missing_dialog)
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self._ui(self._show_mkvtoolnix_missing_dialog,
+                         lambda: self._set_status("Ready"))
             except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: messagebox.showerror("Error",
-                    "mkvinfo timed out - the file may be too large or corrupted"))
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self._ui(lambda: messagebox.showerror("Error",
+                    "mkvinfo timed out - the file may be too large or corrupted"),
+                    lambda: self._set_status("Ready"))
             except Exception as e:
-                self.root.after(0, lambda err=str(e): messagebox.showerror("Error",
-                    f"Failed to load tracks: {err}"))
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self._ui(lambda err=str(e): messagebox.showerror("Error",
+                    f"Failed to load tracks: {err}"),
+                    lambda: self._set_status("Ready"))
 
-        threading.Thread(target=load_tracks, daemon=True).start()
+        self._executor.submit(load_tracks)
 
     def _extract_select_all(self):
         """Select all tracks in the tree."""
@@ -801,9 +1392,13 @@ After installation, restart this application."""
         self.extract_tree.selection_remove(*self.extract_tree.get_children())
 
     def _execute_extract(self):
-        """Execute extraction of selected tracks."""
-        import subprocess
+        """
+        Execute extraction of selected tracks.
 
+        All selected tracks are extracted by a single mkvextract invocation
+        unless BATCHED_TRACK_EXTRACTION is off, in which case each track gets
+        its own call.
+        """
         # Check if MKVToolNix is available
         available, missing = self._check_mkvtoolnix_available()
         if not available:
@@ -824,10 +1419,10 @@ After installation, restart this application."""
         if not output_dir:
             output_dir = str(Path(video_path).parent)
 
-        # Build extraction args
-        video_stem = Path(video_path).stem
+        # Build extraction args; every output file shares the same
+        # "<dir>/<video stem>." prefix
+        out_prefix = os.path.join(output_dir, Path(video_path).stem + '.')
         extract_args = []
-        pgs_codecs = {'s_hdmv/pgs', 's_vobsub'}
 
         for item in selected:
             values = self.extract_tree.item(item, 'values')
@@ -835,34 +1430,69 @@ After installation, restart this application."""
             lang = values[1] if values[1] else f"track{track_id}"
             codec = values[2].lower()
 
-            # Determine extension based on codec
-            if any(pgs in codec for pgs in pgs_codecs) or 'pgs' in codec:
+            # Determine extension based on codec (S_HDMV/PGS, S_VOBSUB, S_TEXT/...)
+            if 'pgs' in codec or codec.startswith('s_vobsub'):
                 ext = '.sup'
-            elif 's_text' in codec or 'subrip' in codec:
+            elif codec.startswith('s_text') or 'subrip' in codec:
                 ext = '.srt'
             else:
                 ext = '.ass'
-            output_file = Path(output_dir) / f"{video_stem}.{lang}.{track_id}{ext}"
 
-            extract_args.append(f"{track_id}:{output_file}")
+            extract_args.append(f"{track_id}:{out_prefix}{lang}.{track_id}{ext}")
 
         # Show progress
         self._set_status("Extracting tracks...")
+        self._idle_ticks = 0
+        self._extract_cancel.clear()
         self.extract_btn.config(state='disabled')
+        self.extract_progress.configure(value=0)
+        self.extract_progress_label.config(text="0%")
         self.extract_progress_label.pack(side=tk.LEFT, padx=(0, 5))
         self.extract_progress.pack(side=tk.LEFT, padx=(0, 10))
-        self.extract_progress.start(10)
+        self.extract_cancel_btn.pack(side=tk.LEFT, padx=(0, 10))
 
         do_ocr = self.extract_ocr_var.get() and self._pgsrip_wrapper
 
         def run_extract():
             try:
-                cmd = ['mkvextract', video_path, 'tracks'] + extract_args
-                logger.info(f"Running: mkvextract with {len(extract_args)} tracks")
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
-
-                if result.returncode == 0:
+                if BATCHED_TRACK_EXTRACTION:
+                    batches = [extract_args]
+                else:
+                    batches = [[arg] for arg in extract_args]
+                logger.info(f"Running: mkvextract with {len(extract_args)} tracks "
+                            f"in {len(batches)} call(s)")
+                self._wake_queue_drain()
+
+                messages = []
+                returncode = 0
+                for i, batch in enumerate(batches):
+                    if self._extract_cancel.is_set():
+                        break
+                    cmd = ['mkvextract', '--gui-mode', video_path, 'tracks'] + batch
+                    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                            text=True, encoding='utf-8', errors='replace',
+                                            **_SUBPROCESS_KWARGS)
+                    self._extract_proc = proc
+                    # A cancel between the check above and here missed this process
+                    if self._extract_cancel.is_set():
+                        proc.terminate()
+
+                    # In GUI mode mkvextract reports "#GUI#progress NN%" lines
+                    for line in proc.stdout:
+                        match = _MKV_PROGRESS_RE.match(line)
+                        if match:
+                            percent = (i * 100 + int(match.group(1))) // len(batches)
+                            self.root.after(0, lambda p=percent: self._set_extract_progress(p))
+                        elif line.strip():
+                            messages.append(line.strip())
+                    returncode = proc.wait()
+                    if returncode != 0:
+                        break
+
+                if self._extract_cancel.is_set():
+                    # Cancelled by the user; partial output files are left as-is
+                    logger.info("Extraction cancelled")
+                elif returncode == 0:
                     ocr_results = []
                     for arg in extract_args:
                         track_id, output = arg.split(':', 1)
@@ -890,25 +1520,37 @@ After installation, restart this application."""
                         msg += "\n\nOCR results:\n" + "\n".join(ocr_results)
                     self.root.after(0, lambda m=msg: messagebox.showinfo("Success", m))
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error",
-                        f"Extraction failed: {result.stderr}"))
+                    details = "\n".join(messages[-10:])
+                    self.root.after(0, messagebox.showerror, "Error", f"Extraction failed: {details}")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Extraction failed: {e}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Extraction failed: {e}")
             finally:
-                self.root.after(0, lambda: self.extract_btn.config(state='normal'))
-                self.root.after(0, lambda: self.extract_progress.stop())
-                self.root.after(0, lambda: self.extract_progress.pack_forget())
-                self.root.after(0, lambda: self.extract_progress_label.pack_forget())
-                self.root.after(0, lambda: self._set_status("Ready"))
-
-        threading.Thread(target=run_extract, daemon=True).start()
-
-    def _create_split_tab(self):
+                self._extract_proc = None
+                self._ui(lambda: self.extract_btn.config(state='normal'),
+                         self.extract_cancel_btn.pack_forget,
+                         self.extract_progress.pack_forget,
+                         self.extract_progress_label.pack_forget,
+                         lambda: self._set_status("Ready"))
+                self._wake_queue_drain()
+
+        self._executor.submit(run_extract)
+
+    def _set_extract_progress(self, percent: int):
+        """Show mkvextract progress in the Extract tab."""
+        self.extract_progress.configure(value=percent)
+        self.extract_progress_label.config(text=f"{percent}%")
+
+    def _cancel_extract(self):
+        """Stop a running mkvextract process."""
+        self._extract_cancel.set()
+        proc = self._extract_proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+        self._set_status("Cancelling extraction...")
+
+    def _create_split_tab_body(self, tab):
         """Create the Split Bilingual Subtitles tab."""
-        tab = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(tab, text="  Split Bilingual  ")
-
         # Intro
         ttk.Label(tab, text="Split bilingual subtitles into separate language files",
                  style='Subtitle.TLabel').pack(anchor='w', pady=(0, 10))
@@ -920,20 +1562,20 @@ After installation, restart this application."""
         file_row = ttk.Frame(file_frame)
         file_row.pack(fill=tk.X)
         self.split_file_var = tk.StringVar()
-        self.split_file_var.trace('w', lambda *args: self._on_split_file_changed())
+        self.split_file_var.trace('w', lambda *args: self._debounce('split', self._on_split_file_changed))
         ttk.Entry(file_row, textvariable=self.split_file_var, width=55).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(file_row, text="Browse...", command=self._browse_split_file).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(file_row, text="Preview",
                   command=lambda: self._show_subtitle_preview(self.split_file_var.get())).pack(side=tk.LEFT, padx=(5, 0))
 
         # Info panel
-        self.split_info_panel = SubtitleInfoPanel(file_frame, "File Info")
+        self.split_info_panel = SubtitleInfoPanel(file_frame, "File Info", executor=self._executor)
         self.split_info_panel.pack(fill=tk.X, pady=(10, 0))
 
         # Bilingual status label
         self.split_status_var = tk.StringVar(value="Select a bilingual subtitle file")
         self.split_status_label = ttk.Label(file_frame, textvariable=self.split_status_var,
-                                            font=('TkDefaultFont', 9, 'italic'))
+                                            font='BissStatus')
         self.split_status_label.pack(anchor='w', pady=(5, 0))
 
         # Options
@@ -977,7 +1619,7 @@ After installation, restart this application."""
         ttk.Entry(out_row, textvariable=self.split_output_dir_var, width=55).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(out_row, text="Browse...", command=self._browse_split_output_dir).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Label(out_frame, text="Leave empty to save alongside input file",
-                 font=('TkDefaultFont', 8)).pack(anchor='w', pady=(3, 0))
+                 font='BissHint').pack(anchor='w', pady=(3, 0))
 
         # Execute button
         btn_frame = ttk.Frame(tab)
@@ -998,6 +1640,7 @@ After installation, restart this application."""
             ]
         )
         if file_path:
+            self._prewarm_probe(file_path)
             self.split_file_var.set(file_path)
 
     def _browse_split_output_dir(self):
@@ -1009,15 +1652,17 @@ After installation, restart this application."""
     def _on_split_file_changed(self):
         """Handle split file selection change."""
         file_path = self.split_file_var.get()
-        if file_path and Path(file_path).exists():
-            self.split_info_panel.update_info(Path(file_path))
+        if file_path and self._cached_exists(file_path):
+            path = Path(file_path)
+            self.split_info_panel.update_info(path)
 
             # Check if bilingual in background
             def check_bilingual():
                 try:
-                    from processors.splitter import BilingualSplitter
-                    splitter = BilingualSplitter()
-                    is_bi = splitter.is_bilingual(Path(file_path))
+                    is_bi = _quick_bilingual_sniff(path)
+                    if is_bi is None:
+                        splitter = self._get_splitter(True)
+                        is_bi = splitter.is_bilingual(path)
                     if is_bi:
                         self.split_status_var.set("Bilingual content detected - ready to split")
                     else:
@@ -1025,10 +1670,19 @@ After installation, restart this application."""
                 except Exception as e:
                     self.split_status_var.set(f"Could not analyze file: {e}")
 
-            threading.Thread(target=check_bilingual, daemon=True).start()
+            self._executor.submit(check_bilingual)
         else:
             self.split_status_var.set("Select a bilingual subtitle file")
 
+    def _get_splitter(self, strip_formatting: bool):
+        """Return a shared BilingualSplitter for the given formatting option."""
+        splitter = self._splitter_cache.get(strip_formatting)
+        if splitter is None:
+            from processors.splitter import BilingualSplitter
+            splitter = BilingualSplitter(strip_formatting=strip_formatting)
+            self._splitter_cache[strip_formatting] = splitter
+        return splitter
+
     def _execute_split(self):
         """Execute the split operation."""
         file_path = self.split_file_var.get()
@@ -1054,9 +1708,7 @@ After installation, restart this application."""
 
         def run_split():
             try:
-                from processors.splitter import BilingualSplitter
-
-                splitter = BilingualSplitter(strip_formatting=strip_formatting)
+                splitter = self._get_splitter(strip_formatting)
                 lang1_path, lang2_path = splitter.split_file(
                     input_path=input_path,
                     output_dir=output_dir,
@@ -1073,23 +1725,19 @@ After installation, restart this application."""
 
                 if results:
                     msg = "Split complete!\n\n" + "\n".join(results)
-                    self.root.after(0, lambda: messagebox.showinfo("Split Complete", msg))
+                    self.root.after(0, messagebox.showinfo, "Split Complete", msg)
                 else:
-                    self.root.after(0, lambda: messagebox.showwarning(
-                        "No Output", "No bilingual content found to split."))
+                    self.root.after(0, messagebox.showwarning, "No Output", "No bilingual content found to split.")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Split Failed", str(e)))
+                self.root.after(0, messagebox.showerror, "Split Failed", str(e))
             finally:
-                self.root.after(0, lambda: self.split_btn.config(state='normal'))
+                self.root.after(0, self._enable_btn, self.split_btn)
 
-        threading.Thread(target=run_split, daemon=True).start()
+        self._executor.submit(run_split)
 
-    def _create_shift_tab(self):
+    def _create_shift_tab_body(self, tab):
         """Create the Shift Timing tab."""
-        tab = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(tab, text="  Shift Timing  ")
-
         # Intro
         ttk.Label(tab, text="Adjust subtitle timing by a fixed offset or set the first line to a specific time",
                  style='Subtitle.TLabel').pack(anchor='w', pady=(0, 10))
@@ -1101,14 +1749,14 @@ After installation, restart this application."""
         file_row = ttk.Frame(file_frame)
         file_row.pack(fill=tk.X)
         self.shift_file_var = tk.StringVar()
-        self.shift_file_var.trace('w', lambda *args: self._on_shift_file_changed())
+        self.shift_file_var.trace('w', lambda *args: self._debounce('shift', self._on_shift_file_changed))
         ttk.Entry(file_row, textvariable=self.shift_file_var, width=55).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(file_row, text="Browse...", command=self._browse_shift_file).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(file_row, text="Preview",
                   command=lambda: self._show_subtitle_preview(self.shift_file_var.get())).pack(side=tk.LEFT, padx=(5, 0))
 
         # Info panel
-        self.shift_info_panel = SubtitleInfoPanel(file_frame, "File Info")
+        self.shift_info_panel = SubtitleInfoPanel(file_frame, "File Info", executor=self._executor)
         self.shift_info_panel.pack(fill=tk.X, pady=(10, 0))
 
         # Shift options
@@ -1139,7 +1787,7 @@ After installation, restart this application."""
         # Quick offset buttons
         quick_frame = ttk.Frame(self.offset_frame)
         quick_frame.pack(side=tk.LEFT, padx=(20, 0))
-        for offset in ["-5s", "-1s", "-0.5s", "+0.5s", "+1s", "+5s"]:
+        for offset in _QUICK_OFFSETS:
             ttk.Button(quick_frame, text=offset, width=5,
                       command=lambda o=offset: self.shift_offset_var.set(o)).pack(side=tk.LEFT, padx=1)
 
@@ -1179,11 +1827,8 @@ After installation, restart this application."""
         ttk.Button(btn_frame, text="Apply Shift", command=self._execute_shift,
                   style='Big.TButton').pack(side=tk.RIGHT)
 
-    def _create_convert_tab(self):
+    def _create_convert_tab_body(self, tab):
         """Create the Convert/Format tab."""
-        tab = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(tab, text="  Convert  ")
-
         # Intro
         ttk.Label(tab, text="Convert subtitle encoding or format (ASS to SRT)",
                  style='Subtitle.TLabel').pack(anchor='w', pady=(0, 10))
@@ -1226,14 +1871,14 @@ After installation, restart this application."""
         file_row = ttk.Frame(file_frame)
         file_row.pack(fill=tk.X)
         self.convert_file_var = tk.StringVar()
-        self.convert_file_var.trace('w', lambda *args: self._on_convert_file_changed())
+        self.convert_file_var.trace('w', lambda *args: self._debounce('convert', self._on_convert_file_changed))
         ttk.Entry(file_row, textvariable=self.convert_file_var, width=55).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(file_row, text="Browse...", command=self._browse_convert_file).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(file_row, text="Preview",
                   command=lambda: self._show_subtitle_preview(self.convert_file_var.get())).pack(side=tk.LEFT, padx=(5, 0))
 
         # Info panel
-        self.convert_info_panel = SubtitleInfoPanel(file_frame, "File Info")
+        self.convert_info_panel = SubtitleInfoPanel(file_frame, "File Info", executor=self._executor)
         self.convert_info_panel.pack(fill=tk.X, pady=(10, 0))
 
         # === Encoding conversion options (shown by default) ===
@@ -1246,7 +1891,7 @@ After installation, restart this application."""
         ttk.Label(detect_row, text="Detected encoding:").pack(side=tk.LEFT)
         self.detected_encoding_var = tk.StringVar(value="Select a file")
         self.encoding_label = ttk.Label(detect_row, textvariable=self.detected_encoding_var,
-                                        font=('TkDefaultFont', 10, 'bold'), foreground='#1E90FF')
+                                        font='BissHeading', foreground='#1E90FF')
         self.encoding_label.pack(side=tk.LEFT, padx=(5, 0))
 
         enc_frame = ttk.Frame(self.encoding_options_frame)
@@ -1254,7 +1899,7 @@ After installation, restart this application."""
         ttk.Label(enc_frame, text="Target encoding:").pack(side=tk.LEFT)
         self.convert_encoding_var = tk.StringVar(value="utf-8")
         enc_combo = ttk.Combobox(enc_frame, textvariable=self.convert_encoding_var, width=15,
-                                values=['utf-8', 'utf-8-sig', 'gb18030', 'gbk', 'big5', 'shift-jis'])
+                                values=_TARGET_ENCODINGS)
         enc_combo.pack(side=tk.LEFT, padx=(5, 0))
 
         self.convert_backup_var = tk.BooleanVar(value=True)
@@ -1357,7 +2002,7 @@ After installation, restart this application."""
                   command=self._detect_sync_offset).pack(side=tk.LEFT, padx=(0, 5))
         self.sync_result_var = tk.StringVar(value="")
         ttk.Label(sync_btn_row, textvariable=self.sync_result_var,
-                 font=('TkDefaultFont', 9)).pack(side=tk.LEFT, padx=(5, 0))
+                 font='BissLabel').pack(side=tk.LEFT, padx=(5, 0))
 
         # Store sync track data
         self._sync_tracks_data = []
@@ -1369,11 +2014,8 @@ After installation, restart this application."""
                                       style='Big.TButton')
         self.convert_btn.pack(side=tk.RIGHT)
 
-    def _create_batch_tab(self):
+    def _create_batch_tab_body(self, tab):
         """Create the Batch Operations tab."""
-        tab = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(tab, text="  Batch Operations  ")
-
         # Intro
         ttk.Label(tab, text="Process multiple files at once",
                  style='Subtitle.TLabel').pack(anchor='w', pady=(0, 10))
@@ -1445,7 +2087,7 @@ After installation, restart this application."""
     def _on_shift_file_changed(self):
         """Handle shift file path change."""
         path = self.shift_file_var.get().strip()
-        if path and Path(path).exists():
+        if path and self._cached_exists(path):
             self.shift_info_panel.update_info(Path(path))
         else:
             self.shift_info_panel.update_info(None)
@@ -1453,12 +2095,12 @@ After installation, restart this application."""
     def _on_convert_file_changed(self):
         """Handle convert file path change."""
         path = self.convert_file_var.get().strip()
-        if path and Path(path).exists():
+        if path and self._cached_exists(path):
             p = Path(path)
             ext = p.suffix.lower()
 
             # Only show info panel for subtitle files (not videos/SUP)
-            if ext not in ('.sup', '.idx', '.sub') and ext not in {e for e in VIDEO_EXTENSIONS}:
+            if ext not in ('.sup', '.idx', '.sub') and ext not in VIDEO_EXTENSIONS:
                 self.convert_info_panel.update_info(p)
                 self._detect_encoding()
 
@@ -1526,7 +2168,7 @@ After installation, restart this application."""
             messagebox.showerror("Error", "Please select an ASS/SSA file to convert")
             return
 
-        if not Path(input_path).exists():
+        if not os.path.isfile(input_path):
             messagebox.showerror("Error", f"File not found: {input_path}")
             return
 
@@ -1534,8 +2176,10 @@ After installation, restart this application."""
             messagebox.showerror("Error", "Selected file is not an ASS/SSA file")
             return
 
-        if not output_path:
-            output_path = str(Path(input_path).with_suffix('.srt'))
+        input_path = Path(input_path)
+        output_path = Path(output_path) if output_path else input_path.with_suffix('.srt')
+        strip_effects = self.ass_strip_effects_var.get()
+        preserve_bilingual = self.ass_bilingual_var.get()
 
         self._set_status("Converting ASS to SRT...")
         self.convert_btn.config(state='disabled')
@@ -1545,23 +2189,21 @@ After installation, restart this application."""
                 from core.ass_converter import ASSToSRTConverter
 
                 converter = ASSToSRTConverter(
-                    strip_effects=self.ass_strip_effects_var.get(),
-                    preserve_bilingual=self.ass_bilingual_var.get()
+                    strip_effects=strip_effects,
+                    preserve_bilingual=preserve_bilingual
                 )
 
-                result_path = converter.convert_file(Path(input_path), Path(output_path))
+                result_path = converter.convert_file(input_path, output_path)
 
-                self.root.after(0, lambda: messagebox.showinfo("Success",
-                    f"Converted successfully!\n\nOutput: {result_path.name}"))
+                self.root.after(0, messagebox.showinfo, "Success", f"Converted successfully!\n\nOutput: {result_path.name}")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error",
-                    f"Conversion failed: {e}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Conversion failed: {e}")
             finally:
-                self.root.after(0, lambda: self.convert_btn.config(state='normal'))
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self._ui(lambda: self.convert_btn.config(state='normal'),
+                         lambda: self._set_status("Ready"))
 
-        threading.Thread(target=do_convert, daemon=True).start()
+        self._executor.submit(do_convert)
 
     def _browse_pgs_output(self):
         """Browse for PGS conversion output file."""
@@ -1623,10 +2265,10 @@ After installation, restart this application."""
 
                 self.root.after(0, update_ui)
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Track detection failed: {e}"))
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self._ui(lambda: messagebox.showerror("Error", f"Track detection failed: {e}"),
+                         lambda: self._set_status("Ready"))
 
-        threading.Thread(target=do_detect, daemon=True).start()
+        self._executor.submit(do_detect)
 
     def _execute_pgs_convert(self):
         """Execute PGS to SRT OCR conversion."""
@@ -1667,8 +2309,7 @@ After installation, restart this application."""
                 else:
                     # Video file — use selected track
                     if not self._pgs_detected_tracks:
-                        self.root.after(0, lambda: messagebox.showerror("Error",
-                            "No PGS tracks detected. Click 'Detect Tracks' first."))
+                        self.root.after(0, messagebox.showerror, "Error", "No PGS tracks detected. Click 'Detect Tracks' first.")
                         return
 
                     # Find selected track index
@@ -1691,29 +2332,24 @@ After installation, restart this application."""
                     )
 
                 if success:
-                    self.root.after(0, lambda: messagebox.showinfo("Success",
-                        f"PGS converted successfully!\n\nOutput: {output_file.name}"))
+                    self.root.after(0, messagebox.showinfo, "Success", f"PGS converted successfully!\n\nOutput: {output_file.name}")
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error",
-                        "PGS conversion failed - check log for details"))
+                    self.root.after(0, messagebox.showerror, "Error", "PGS conversion failed - check log for details")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error",
-                    f"PGS conversion failed: {e}"))
+                self.root.after(0, messagebox.showerror, "Error", f"PGS conversion failed: {e}")
             finally:
-                self.root.after(0, lambda: self.convert_btn.config(state='normal'))
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self._ui(lambda: self.convert_btn.config(state='normal'),
+                         lambda: self._set_status("Ready"))
 
-        threading.Thread(target=do_pgs_convert, daemon=True).start()
+        self._executor.submit(do_pgs_convert)
 
     def _detect_file_language(self, path: Path) -> str:
         """Detect language of a subtitle file."""
         try:
-            from core.language_detection import LanguageDetector
-            lang = LanguageDetector.detect_language_from_filename(str(path))
-            if lang == 'unknown':
-                lang = LanguageDetector.detect_subtitle_language(path)
-            return {'zh': 'Chinese', 'en': 'English', 'ja': 'Japanese', 'ko': 'Korean'}.get(lang, lang.upper())
+            st = os.stat(path)
+            lang = _detect_language_cached(str(path), st.st_mtime_ns, st.st_size)
+            return _LANGUAGE_NAMES.get(lang) or lang.upper()
         except (IOError, OSError, ValueError, UnicodeDecodeError):
             return ""
 
@@ -1737,15 +2373,27 @@ After installation, restart this application."""
         self.chinese_track_var.set(track2)
         self.english_track_var.set(track1)
 
-        # Swap external file paths
+        # Swap external file paths. The language labels already describe
+        # these files, so swap them too instead of letting the debounced
+        # file traces re-detect both - unless a detection was still pending.
+        labels_current = not ({'chinese', 'english'} & self._debounce_jobs.keys())
         file1 = self.chinese_file_var.get()
         file2 = self.english_file_var.get()
         self.chinese_file_var.set(file2)
         self.english_file_var.set(file1)
+        if labels_current:
+            for key in ('chinese', 'english'):
+                job = self._debounce_jobs.pop(key, None)
+                if job is not None:
+                    self.root.after_cancel(job)
+            label1 = self.chinese_lang_label.cget('text')
+            label2 = self.english_lang_label.cget('text')
+            self.chinese_lang_label.config(text=label2)
+            self.english_lang_label.config(text=label1)
 
         # Update UI to reflect changes
-        self._update_chinese_source()
-        self._update_english_source()
+        self._update_source('chinese')
+        self._update_source('english')
 
     def _update_shift_mode(self):
         """Update UI based on shift mode selection."""
@@ -1756,73 +2404,109 @@ After installation, restart this application."""
             self.offset_frame.pack_forget()
             self.firstline_frame.pack(fill=tk.X, pady=(0, 5))
 
-    def _update_chinese_source(self):
-        """Update Track 1 subtitle source UI."""
-        source = self.chinese_source_var.get()
-        self.chinese_auto_frame.pack_forget()
-        self.chinese_track_frame.pack_forget()
-        self.chinese_file_frame.pack_forget()
-
-        if source == "auto":
-            self.chinese_auto_frame.pack(fill=tk.X, pady=(5, 0))
-        elif source == "embedded":
-            self.chinese_track_frame.pack(fill=tk.X, pady=(5, 0))
-        elif source == "external":
-            self.chinese_file_frame.pack(fill=tk.X, pady=(5, 0))
-
-    def _update_english_source(self):
-        """Update Track 2 subtitle source UI."""
-        source = self.english_source_var.get()
-        self.english_auto_frame.pack_forget()
-        self.english_track_frame.pack_forget()
-        self.english_file_frame.pack_forget()
-
-        if source == "auto":
-            self.english_auto_frame.pack(fill=tk.X, pady=(5, 0))
-        elif source == "embedded":
-            self.english_track_frame.pack(fill=tk.X, pady=(5, 0))
-        elif source == "external":
-            self.english_file_frame.pack(fill=tk.X, pady=(5, 0))
+    def _update_source(self, side: str):
+        """
+        Show the source frame matching a track's selected source mode.
+
+        Args:
+            side: 'chinese' for Track 1 or 'english' for Track 2
+        """
+        mode = self._source_vars[side].get()
+        current = self._current_source_mode[side]
+        if mode == current:
+            return
+
+        frames = self._source_frames[side]
+        if current in frames:
+            frames[current].pack_forget()
+        if mode in frames:
+            frames[mode].pack(fill=tk.X, pady=(5, 0))
+        self._current_source_mode[side] = mode
 
     def _on_video_changed(self):
         """Handle video file selection change - auto-scan tracks."""
         video_path = self.merge_video_var.get().strip()
-        if video_path and Path(video_path).exists():
-            # Auto-scan for external subtitles
-            self._find_external_subs(Path(video_path))
-            # Auto-scan embedded tracks
-            self._scan_video_tracks()
-
-    def _find_external_subs(self, video_path: Path):
-        """Find external subtitle files next to the video."""
-        self.external_subs_found = []
-        video_dir = video_path.parent
+        if video_path and self._cached_exists(video_path):
+            # Scan for external subtitles and embedded tracks concurrently;
+            # each result updates tracks_label as it arrives
+            external_subs = self._executor.submit(self._find_external_subs, Path(video_path))
+            self._scan_video_tracks(external_subs)
+
+    def _find_external_subs(self, video_path: Path) -> List[Path]:
+        """Find external subtitle files next to the video (runs in a worker)."""
         video_stem = video_path.stem
 
-        # Look for subtitle files with similar names
-        for ext in ['.srt', '.ass', '.ssa', '.vtt']:
-            for sub_file in video_dir.glob(f"{video_stem}*{ext}"):
-                if sub_file.is_file():
-                    self.external_subs_found.append(sub_file)
+        # Look for subtitle files with similar names in one directory pass;
+        # DirEntry.is_file() uses the type cached from the listing
+        found = []
+        try:
+            with os.scandir(video_path.parent) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith(video_stem):
+                        continue
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot:].lower() in SUBTITLE_EXTENSIONS and entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError as e:
+            logger.debug(f"Could not scan for external subtitles: {e}")
+        found.sort()
+        return found
+
+    def _external_subs_summary(self) -> str:
+        """Name the first few external subtitles found, for tracks_label."""
+        sub_names = [f.name for f in self.external_subs_found[:5]]
+        more = f" (+{len(self.external_subs_found) - 5} more)" if len(self.external_subs_found) > 5 else ""
+        return f"External subs found: {', '.join(sub_names)}{more}"
+
+    def _show_external_subs(self, video_path: str, found: List[Path]):
+        """Store and display external subtitles found next to video_path."""
+        if video_path != self.merge_video_var.get().strip():
+            # Another video was picked while this one was being scanned
+            return
+        self.external_subs_found = found
+        self._refresh_tracks_label()
 
-        # Update UI to show found subs
+    def _refresh_tracks_label(self):
+        """Show the embedded track summary (once scanned) and any external subs."""
+        parts = [self._tracks_summary] if self._tracks_summary else []
         if self.external_subs_found:
-            sub_names = [f.name for f in self.external_subs_found[:5]]  # Show first 5
-            more = f" (+{len(self.external_subs_found) - 5} more)" if len(self.external_subs_found) > 5 else ""
-            self.tracks_label.config(text=f"External subs found: {', '.join(sub_names)}{more}")
+            parts.append(self._external_subs_summary())
+        if parts:
+            self.tracks_label.config(text="; ".join(parts))
 
-    def _scan_video_tracks(self):
-        """Scan video for embedded subtitle tracks."""
+    def _scan_video_tracks(self, external_subs: Optional[concurrent.futures.Future] = None):
+        """
+        Scan video for embedded subtitle tracks.
+
+        Args:
+            external_subs: Pending _find_external_subs result, shown once it
+                resolves, or None to keep the current external subs
+        """
         video_path = self.merge_video_var.get().strip()
+        if external_subs is not None:
+            self.external_subs_found = []
+
+            def on_external_subs(future):
+                # Runs on the worker, or right here if the scan already finished
+                try:
+                    self.root.after(0, self._show_external_subs, video_path, future.result())
+                except (RuntimeError, tk.TclError):
+                    # Window already destroyed
+                    pass
+
+            external_subs.add_done_callback(on_external_subs)
+
         if not video_path:
             messagebox.showerror("Error", "Please select a video file first")
             return
 
-        if not Path(video_path).exists():
+        if not os.path.exists(video_path):
             messagebox.showerror("Error", f"File not found: {video_path}")
             return
 
         self._set_status("Scanning video tracks...")
+        self._tracks_summary = None
 
         def do_scan():
             try:
@@ -1845,14 +2529,15 @@ After installation, restart this application."""
 
                     # Categorize by language
                     lang_lower = lang.lower()
-                    if any(c in lang_lower for c in ['chi', 'zh', 'cn', 'jpn', 'ja', 'kor', 'ko']):
+                    if _CJK_TRACK_LANG_RE.search(lang_lower):
                         chinese_tracks.append((t.track_id, label))
-                    elif any(c in lang_lower for c in ['eng', 'en']):
+                    elif _EN_TRACK_LANG_RE.search(lang_lower):
                         english_tracks.append((t.track_id, label))
 
                 def update_ui():
                     # Update comboboxes
                     all_labels = [opt[1] for opt in track_options]
+                    self._label_to_track_id = {opt[1]: str(opt[0]) for opt in track_options}
                     self.chinese_track_combo['values'] = all_labels
                     self.english_track_combo['values'] = all_labels
 
@@ -1871,27 +2556,24 @@ After installation, restart this application."""
 
                     # Update status
                     if tracks:
-                        track_summary = f"Found {len(tracks)} embedded track(s)"
-                        if self.external_subs_found:
-                            track_summary += f", {len(self.external_subs_found)} external file(s)"
-                        self.tracks_label.config(text=track_summary)
+                        self._tracks_summary = f"Found {len(tracks)} embedded track(s)"
                     else:
-                        self.tracks_label.config(text="No embedded subtitle tracks found")
+                        self._tracks_summary = "No embedded subtitle tracks found"
+                    self._refresh_tracks_label()
 
                     self._set_status("Ready")
 
                 self.root.after(0, update_ui)
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to scan tracks: {e}"))
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self._ui(lambda err=str(e): messagebox.showerror("Error", f"Failed to scan tracks: {err}"),
+                         lambda: self._set_status("Ready"))
 
-        threading.Thread(target=do_scan, daemon=True).start()
+        self._executor.submit(do_scan)
 
     def _browse_sub_file(self, lang_type: str):
         """Browse for subtitle file for Chinese or English."""
-        filetypes = [("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*")]
-        path = filedialog.askopenfilename(title=f"Select {lang_type.title()} Subtitle", filetypes=filetypes)
+        path = filedialog.askopenfilename(title=f"Select {lang_type.title()} Subtitle", filetypes=_SUB_FILETYPES)
         if path:
             if lang_type == 'chinese':
                 self.chinese_file_var.set(path)
@@ -1900,26 +2582,35 @@ After installation, restart this application."""
 
     def _on_chinese_file_changed(self):
         """Update language label when Track 1 file changes."""
-        path = self.chinese_file_var.get().strip()
-        if path and Path(path).exists():
-            lang = self._detect_file_language(Path(path))
-            self.chinese_lang_label.config(text=f"[{lang}]" if lang else "")
-        else:
-            self.chinese_lang_label.config(text="")
+        self._refresh_file_language(self.chinese_file_var.get().strip(), self.chinese_lang_label)
 
     def _on_english_file_changed(self):
         """Update language label when Track 2 file changes."""
-        path = self.english_file_var.get().strip()
-        if path and Path(path).exists():
+        self._refresh_file_language(self.english_file_var.get().strip(), self.english_lang_label)
+
+    def _refresh_file_language(self, path: str, label: ttk.Label):
+        """Detect a track file's language on the executor, then label it."""
+        if not path or not self._cached_exists(path):
+            label.config(text="")
+            return
+
+        def detect():
             lang = self._detect_file_language(Path(path))
-            self.english_lang_label.config(text=f"[{lang}]" if lang else "")
-        else:
-            self.english_lang_label.config(text="")
+            self.root.after(0, self._apply_file_language, path, lang)
+
+        self._executor.submit(detect)
+
+    def _apply_file_language(self, path: str, lang: str):
+        """Label whichever track still holds path (the tracks may have been swapped)."""
+        for file_var, label in ((self.chinese_file_var, self.chinese_lang_label),
+                                (self.english_file_var, self.english_lang_label)):
+            if file_var.get().strip() == path:
+                label.config(text=f"[{lang}]" if lang else "")
 
     def _preview_embedded_track(self, track_type: str):
         """Preview an embedded subtitle track by extracting and showing it."""
         video_path = self.merge_video_var.get().strip()
-        if not video_path or not Path(video_path).exists():
+        if not video_path or not os.path.exists(video_path):
             messagebox.showerror("Error", "Please select a video file first")
             return
 
@@ -1932,84 +2623,116 @@ After installation, restart this application."""
             messagebox.showerror("Error", "Please select a track first")
             return
 
-        # Extract track ID from label "Track X: ..."
-        try:
-            track_id = track_label.split(":")[0].replace("Track", "").strip()
-        except:
+        track_id = self._label_to_track_id.get(track_label)
+        if track_id is None:
             messagebox.showerror("Error", "Could not parse track ID")
             return
 
         self._set_status(f"Extracting track {track_id} for preview...")
 
         def do_extract():
+            key = (video_path, track_id)
+            with self._preview_lock:
+                if key in self._preview_inflight:
+                    # Already being extracted; that run shows the preview
+                    return
+                self._preview_inflight.add(key)
+                cached = self._preview_cache.get(key)
+
+            tmp_path = None
+            success = False
             try:
                 import tempfile
                 from core.video_containers import VideoContainerHandler
 
+                # Re-show an earlier extraction if the video hasn't changed since
+                if cached is not None:
+                    try:
+                        if os.stat(cached).st_mtime >= os.stat(video_path).st_mtime:
+                            success = True
+                            self.root.after(0, self._show_subtitle_preview, str(cached))
+                            return
+                    except OSError:
+                        pass
+
                 handler = VideoContainerHandler()
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp:
-                    tmp_path = Path(tmp.name)
+                if cached is not None:
+                    tmp_path = cached
+                else:
+                    with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp:
+                        tmp_path = Path(tmp.name)
 
                 # Extract the track
                 success = handler.extract_subtitle_track(
                     video_path=Path(video_path),
                     track_id=track_id,
                     output_path=tmp_path
-                )
+                ) and tmp_path.exists()
 
-                if success and tmp_path.exists():
-                    self.root.after(0, lambda: self._show_subtitle_preview(str(tmp_path)))
+                if success:
+                    # Only a finished extraction may be re-shown later
+                    with self._preview_lock:
+                        self._preview_cache[key] = tmp_path
+                    self.root.after(0, self._show_subtitle_preview, str(tmp_path))
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to extract track"))
+                    self.root.after(0, messagebox.showerror, "Error", "Failed to extract track")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Preview failed: {e}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Preview failed: {e}")
             finally:
-                self.root.after(0, lambda: self._set_status("Ready"))
-
-        threading.Thread(target=do_extract, daemon=True).start()
+                with self._preview_lock:
+                    self._preview_inflight.discard(key)
+                    if not success:
+                        # Don't leave a stale or empty file cached; the next
+                        # preview retries the extraction
+                        self._preview_cache.pop(key, None)
+                if not success and tmp_path is not None:
+                    try:
+                        tmp_path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                self.root.after(0, self._set_status, "Ready")
+
+        self._executor.submit(do_extract)
+
+    def _cleanup_preview_files(self):
+        """Delete the temporary files written by _preview_embedded_track."""
+        with self._preview_lock:
+            paths = list(self._preview_cache.values())
+            self._preview_cache.clear()
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
     # ==================== File Browsers ====================
 
     def _browse_shift_file(self):
         """Browse for subtitle file to shift."""
-        filetypes = [("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*")]
-        path = filedialog.askopenfilename(title="Select Subtitle File", filetypes=filetypes)
+        path = filedialog.askopenfilename(title="Select Subtitle File", filetypes=_SUB_FILETYPES)
         if path:
+            self._prewarm_probe(path)
             self.shift_file_var.set(path)
 
     def _browse_shift_output(self):
         """Browse for shift output file."""
-        filetypes = [("SRT files", "*.srt"), ("ASS files", "*.ass"), ("All files", "*.*")]
-        path = filedialog.asksaveasfilename(title="Save As", filetypes=filetypes, defaultextension=".srt")
+        path = filedialog.asksaveasfilename(title="Save As", filetypes=_SRT_FILETYPES, defaultextension=".srt")
         if path:
             self.shift_output_var.set(path)
 
     def _browse_convert_file(self):
         """Browse for file to convert (subtitle, video, or SUP depending on mode)."""
-        if self.convert_type_var.get() == 'pgs_ocr':
-            filetypes = [
-                ("Video & SUP files", "*.mkv *.mp4 *.m4v *.mov *.avi *.ts *.sup"),
-                ("SUP files", "*.sup"),
-                ("Video files", "*.mkv *.mp4 *.m4v *.mov *.avi *.ts *.webm"),
-                ("VobSub files", "*.idx *.sub"),
-                ("All files", "*.*")
-            ]
-            title = "Select Video or Subtitle File"
-        elif self.convert_type_var.get() == 'sync':
-            filetypes = [("SRT files", "*.srt"), ("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*")]
-            title = "Select External Subtitle File"
-        else:
-            filetypes = [("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*")]
-            title = "Select Subtitle File"
+        title, filetypes = _CONVERT_BROWSE.get(
+            self.convert_type_var.get(), ("Select Subtitle File", _SUB_FILETYPES))
         path = filedialog.askopenfilename(title=title, filetypes=filetypes)
         if path:
+            self._prewarm_probe(path)
             self.convert_file_var.set(path)
 
     def _browse_sync_video(self):
         """Browse for video file for sync operation."""
-        filetypes = [("Video files", "*.mkv *.mp4 *.avi *.mov *.webm *.ts"), ("All files", "*.*")]
-        path = filedialog.askopenfilename(title="Select Video File", filetypes=filetypes)
+        path = filedialog.askopenfilename(title="Select Video File", filetypes=_VIDEO_FILETYPES)
         if path:
             self.sync_video_var.set(path)
             # Auto-load tracks
@@ -2018,7 +2741,7 @@ After installation, restart this application."""
     def _load_sync_tracks(self):
         """Load subtitle tracks from video for sync track selection."""
         video_path = self.sync_video_var.get().strip()
-        if not video_path or not Path(video_path).exists():
+        if not video_path or not os.path.exists(video_path):
             messagebox.showerror("Error", "Please select a valid video file first")
             return
 
@@ -2036,11 +2759,11 @@ After installation, restart this application."""
                     label = f"s:{t['rel_index']} {t['lang']} {t['title']} ({t['codec']})"
                     labels.append(label.strip())
 
-                self.root.after(0, lambda: self._update_sync_track_combo(labels))
+                self.root.after(0, self._update_sync_track_combo, labels)
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load tracks: {e}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Failed to load tracks: {e}")
 
-        threading.Thread(target=do_load, daemon=True).start()
+        self._executor.submit(do_load)
 
     def _update_sync_track_combo(self, labels):
         """Update the sync track combobox with available tracks."""
@@ -2053,10 +2776,10 @@ After installation, restart this application."""
         sub_path = self.convert_file_var.get().strip()
         video_path = self.sync_video_var.get().strip()
 
-        if not sub_path or not Path(sub_path).exists():
+        if not sub_path or not os.path.exists(sub_path):
             messagebox.showerror("Error", "Please select a subtitle file")
             return
-        if not video_path or not Path(video_path).exists():
+        if not video_path or not os.path.exists(video_path):
             messagebox.showerror("Error", "Please select a video file")
             return
 
@@ -2086,28 +2809,28 @@ After installation, restart this application."""
                     msg = (f"Offset: {result.offset_ms:+d}ms | "
                            f"Matches: {result.match_count}/{result.total_compared} | "
                            f"Track: {result.track_used}")
-                    self.root.after(0, lambda: self.sync_result_var.set(msg))
+                    self.root.after(0, self.sync_result_var.set, msg)
                 else:
-                    self.root.after(0, lambda: self.sync_result_var.set(f"Failed: {result.message}"))
+                    self.root.after(0, self.sync_result_var.set, f"Failed: {result.message}")
 
             except Exception as e:
-                self.root.after(0, lambda: self.sync_result_var.set(f"Error: {e}"))
+                self.root.after(0, self.sync_result_var.set, f"Error: {e}")
             finally:
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self.root.after(0, self._set_status, "Ready")
 
         self._set_status("Detecting offset...")
         self.sync_result_var.set("Detecting...")
-        threading.Thread(target=do_detect, daemon=True).start()
+        self._executor.submit(do_detect)
 
     def _execute_sync(self):
         """Execute the sync operation (detect offset and apply)."""
         sub_path = self.convert_file_var.get().strip()
         video_path = self.sync_video_var.get().strip()
 
-        if not sub_path or not Path(sub_path).exists():
+        if not sub_path or not os.path.exists(sub_path):
             messagebox.showerror("Error", "Please select a subtitle file")
             return
-        if not video_path or not Path(video_path).exists():
+        if not video_path or not os.path.exists(video_path):
             messagebox.showerror("Error", "Please select a video file")
             return
 
@@ -2139,34 +2862,30 @@ After installation, restart this application."""
                            f"Shift applied: {result.shift_applied_ms:+d}ms\n"
                            f"Matches: {result.match_count}/{result.total_compared}\n"
                            f"Track: {result.track_used}")
-                    self.root.after(0, lambda: messagebox.showinfo("Sync Result", msg))
-                    self.root.after(0, lambda: self.sync_result_var.set(
-                        f"Applied: {result.shift_applied_ms:+d}ms"))
+                    self._ui(lambda: messagebox.showinfo("Sync Result", msg),
+                             lambda: self.sync_result_var.set(
+                                 f"Applied: {result.shift_applied_ms:+d}ms"))
                 else:
-                    self.root.after(0, lambda: messagebox.showerror(
-                        "Sync Failed", result.message))
-                    self.root.after(0, lambda: self.sync_result_var.set(
-                        f"Failed: {result.message}"))
+                    self.root.after(0, messagebox.showerror, "Sync Failed", result.message)
+                    self.root.after(0, self.sync_result_var.set, f"Failed: {result.message}")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Sync failed: {e}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Sync failed: {e}")
             finally:
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self.root.after(0, self._set_status, "Ready")
 
         self._set_status("Syncing subtitle...")
-        threading.Thread(target=do_sync, daemon=True).start()
+        self._executor.submit(do_sync)
 
     def _browse_merge_video(self):
         """Browse for video file."""
-        filetypes = [("Video files", "*.mkv *.mp4 *.avi *.mov *.webm *.ts"), ("All files", "*.*")]
-        path = filedialog.askopenfilename(title="Select Video File", filetypes=filetypes)
+        path = filedialog.askopenfilename(title="Select Video File", filetypes=_VIDEO_FILETYPES)
         if path:
             self.merge_video_var.set(path)
 
     def _browse_merge_output(self):
         """Browse for merge output file."""
-        filetypes = [("SRT files", "*.srt"), ("ASS files", "*.ass"), ("All files", "*.*")]
-        path = filedialog.asksaveasfilename(title="Save As", filetypes=filetypes, defaultextension=".srt")
+        path = filedialog.asksaveasfilename(title="Save As", filetypes=_SRT_FILETYPES, defaultextension=".srt")
         if path:
             self.merge_output_var.set(path)
 
@@ -2178,25 +2897,23 @@ After installation, restart this application."""
 
     def _open_subtitle(self):
         """Open subtitle file from menu."""
-        filetypes = [("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*")]
-        path = filedialog.askopenfilename(title="Open Subtitle File", filetypes=filetypes)
+        path = filedialog.askopenfilename(title="Open Subtitle File", filetypes=_SUB_FILETYPES)
         if path:
             # Auto-detect language and assign to appropriate field
             lang = self._detect_file_language(Path(path))
             if lang in ['Chinese', 'Japanese', 'Korean']:
                 self.chinese_file_var.set(path)
                 self.chinese_source_var.set("external")
-                self._update_chinese_source()
+                self._update_source('chinese')
             else:
                 self.english_file_var.set(path)
                 self.english_source_var.set("external")
-                self._update_english_source()
+                self._update_source('english')
             self.notebook.select(0)
 
     def _open_video(self):
         """Open video file from menu."""
-        filetypes = [("Video files", "*.mkv *.mp4 *.avi *.mov *.webm"), ("All files", "*.*")]
-        path = filedialog.askopenfilename(title="Open Video File", filetypes=filetypes)
+        path = filedialog.askopenfilename(title="Open Video File", filetypes=_VIDEO_FILETYPES)
         if path:
             self.merge_video_var.set(path)
             self.notebook.select(0)
@@ -2210,44 +2927,41 @@ After installation, restart this application."""
             messagebox.showerror("Error", "Please select a subtitle file")
             return
 
-        if not Path(input_path).exists():
+        if not os.path.isfile(input_path):
             messagebox.showerror("Error", f"File not found: {input_path}")
             return
 
-        output_path = self.shift_output_var.get().strip() or None
+        input_path = Path(input_path)
+        output_path = self.shift_output_var.get().strip()
+        output_path = Path(output_path) if output_path else None
         create_backup = self.shift_backup_var.get()
+        by_offset = self.shift_mode_var.get() == "offset"
+        offset_str = self.shift_offset_var.get().strip()
+        timestamp = self.shift_firstline_var.get().strip()
 
         def run_shift():
             try:
                 from processors.timing_adjuster import TimingAdjuster
                 adjuster = TimingAdjuster(create_backup=create_backup)
 
-                if self.shift_mode_var.get() == "offset":
-                    offset_str = self.shift_offset_var.get().strip()
+                if by_offset:
                     offset_ms = adjuster.parse_offset_string(offset_str)
-                    success = adjuster.adjust_by_offset(
-                        Path(input_path), offset_ms,
-                        Path(output_path) if output_path else None
-                    )
+                    success = adjuster.adjust_by_offset(input_path, offset_ms, output_path)
                 else:
-                    timestamp = self.shift_firstline_var.get().strip()
-                    success = adjuster.adjust_first_line_to(
-                        Path(input_path), timestamp,
-                        Path(output_path) if output_path else None
-                    )
+                    success = adjuster.adjust_first_line_to(input_path, timestamp, output_path)
 
                 if success:
-                    self.root.after(0, lambda: messagebox.showinfo("Success", "Timing shift applied successfully!"))
+                    self.root.after(0, messagebox.showinfo, "Success", "Timing shift applied successfully!")
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to shift timing"))
+                    self.root.after(0, messagebox.showerror, "Error", "Failed to shift timing")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Shift failed: {str(e)}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Shift failed: {str(e)}")
             finally:
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self.root.after(0, self._set_status, "Ready")
 
         self._set_status("Shifting timing...")
-        threading.Thread(target=run_shift, daemon=True).start()
+        self._executor.submit(run_shift)
 
     def _execute_convert(self):
         """Execute the encoding conversion."""
@@ -2256,10 +2970,11 @@ After installation, restart this application."""
             messagebox.showerror("Error", "Please select a subtitle file")
             return
 
-        if not Path(input_path).exists():
+        if not os.path.isfile(input_path):
             messagebox.showerror("Error", f"File not found: {input_path}")
             return
 
+        input_path = Path(input_path)
         encoding = self.convert_encoding_var.get()
         create_backup = self.convert_backup_var.get()
         force = self.convert_force_var.get()
@@ -2271,7 +2986,7 @@ After installation, restart this application."""
                 converter = EncodingConverter()
 
                 result = converter.convert_file(
-                    file_path=Path(input_path),
+                    file_path=input_path,
                     keep_backup=create_backup,
                     force_conversion=force,
                     target_encoding=encoding,
@@ -2284,17 +2999,17 @@ After installation, restart this application."""
                         msg += "\n\nFont replacements:"
                         for style_name, old_font, new_font in result.fonts_fixed:
                             msg += f"\n  [{style_name}] '{old_font}' -> '{new_font}'"
-                    self.root.after(0, lambda: messagebox.showinfo("Success", msg))
+                    self.root.after(0, messagebox.showinfo, "Success", msg)
                 else:
-                    self.root.after(0, lambda: messagebox.showinfo("Info", "No conversion needed (already correct encoding)"))
+                    self.root.after(0, messagebox.showinfo, "Info", "No conversion needed (already correct encoding)")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Conversion failed: {str(e)}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Conversion failed: {str(e)}")
             finally:
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self.root.after(0, self._set_status, "Ready")
 
         self._set_status("Converting encoding...")
-        threading.Thread(target=run_convert, daemon=True).start()
+        self._executor.submit(run_convert)
 
     def _execute_merge(self):
         """Execute the merge operation with flexible source selection."""
@@ -2302,6 +3017,9 @@ After installation, restart this application."""
         chinese_source = self.chinese_source_var.get()
         english_source = self.english_source_var.get()
 
+        # Files that must exist, checked together below as (label, path)
+        required = []
+
         # Resolve Track 1 subtitle source
         chinese_path = None
         chinese_track = None
@@ -2311,21 +3029,13 @@ After installation, restart this application."""
             if not chinese_path:
                 messagebox.showerror("Error", "Please select a subtitle file for Track 1")
                 return
-            if not Path(chinese_path).exists():
-                messagebox.showerror("Error", f"Track 1 subtitle not found: {chinese_path}")
-                return
+            required.append(("Track 1 subtitle", chinese_path))
             chinese_path = Path(chinese_path)
         elif chinese_source == "embedded":
             if not video_path:
                 messagebox.showerror("Error", "Please select a video file to use embedded tracks")
                 return
-            track_label = self.chinese_track_var.get()
-            if track_label:
-                # Extract track ID from label "Track X: ..."
-                try:
-                    chinese_track = track_label.split(":")[0].replace("Track", "").strip()
-                except:
-                    pass
+            chinese_track = self._label_to_track_id.get(self.chinese_track_var.get())
 
         # Resolve Track 2 subtitle source
         english_path = None
@@ -2336,20 +3046,13 @@ After installation, restart this application."""
             if not english_path:
                 messagebox.showerror("Error", "Please select a subtitle file for Track 2")
                 return
-            if not Path(english_path).exists():
-                messagebox.showerror("Error", f"Track 2 subtitle not found: {english_path}")
-                return
+            required.append(("Track 2 subtitle", english_path))
             english_path = Path(english_path)
         elif english_source == "embedded":
             if not video_path:
                 messagebox.showerror("Error", "Please select a video file to use embedded tracks")
                 return
-            track_label = self.english_track_var.get()
-            if track_label:
-                try:
-                    english_track = track_label.split(":")[0].replace("Track", "").strip()
-                except:
-                    pass
+            english_track = self._label_to_track_id.get(self.english_track_var.get())
 
         # Validate we have at least one source specified if not auto
         if chinese_source == "auto" and english_source == "auto":
@@ -2357,12 +3060,16 @@ After installation, restart this application."""
                 messagebox.showerror("Error", "Please select a video file or specify subtitle sources")
                 return
 
-        # Validate video exists if needed
-        if video_path and not Path(video_path).exists():
-            messagebox.showerror("Error", f"Video file not found: {video_path}")
+        # Report every missing input in one dialog
+        if video_path:
+            required.append(("Video", video_path))
+        missing = [f"- {label}: {path}" for label, path in required if not os.path.exists(path)]
+        if missing:
+            messagebox.showerror("Error", "Missing files:\n" + "\n".join(missing))
             return
 
-        output_path = self.merge_output_var.get().strip() or None
+        output_path = self.merge_output_var.get().strip()
+        output_path = Path(output_path) if output_path else None
         auto_align = self.merge_autoalign_var.get()
         use_translation = self.merge_translation_var.get()
         threshold = float(self.merge_threshold_var.get() or 0.8)
@@ -2371,23 +3078,43 @@ After installation, restart this application."""
 
         def update_progress(step_name: str, current: int, total: int):
             """Update progress bar and label from merger callback."""
-            if total > 0:
-                percent = int((current / total) * 100)
-                self.root.after(0, lambda: self.merge_progress.configure(value=percent))
-            self.root.after(0, lambda s=step_name: self.merge_progress_label.configure(text=s))
-            self.root.after(0, lambda s=step_name: self._set_status(f"Merging: {s}"))
+            # The merger may report once per cue; only redraw at ~30 fps,
+            # but never drop the final update.
+            now = time.monotonic()
+            if current != total and now - self._last_progress_ts < PROGRESS_MIN_INTERVAL:
+                return
+            self._last_progress_ts = now
+
+            percent = int((current / total) * 100) if total > 0 else None
+
+            def apply():
+                if percent is not None:
+                    self.merge_progress.configure(value=percent)
+                self.merge_progress_label.configure(text=step_name)
+                self._set_status(f"Merging: {step_name}")
+
+            self.root.after(0, apply)
+            self._wake_queue_drain()
 
         def run_merge():
             try:
                 logger.info(f"Starting merge operation for: {video_path or 'external files'}")
+                self._wake_queue_drain()
                 from processors.merger import BilingualMerger
 
+                # Creating the translation service tests the API connection,
+                # so do that once per session rather than on every merge
+                if use_translation and self._translation_service is None:
+                    from core.translation_service import get_translation_service
+                    self._translation_service = get_translation_service()
+
                 merger = BilingualMerger(
                     auto_align=auto_align,
                     use_translation=use_translation,
                     alignment_threshold=threshold,
                     top_language=top_language,
-                    progress_callback=update_progress
+                    progress_callback=update_progress,
+                    translation_service=self._translation_service
                 )
 
                 # Determine merge approach based on sources
@@ -2398,7 +3125,7 @@ After installation, restart this application."""
                         chinese_sub=chinese_path,
                         english_sub=english_path,
                         output_format=output_format,
-                        output_path=Path(output_path) if output_path else None,
+                        output_path=output_path,
                         chinese_track=chinese_track,
                         english_track=english_track
                     )
@@ -2408,7 +3135,7 @@ After installation, restart this application."""
                     success = merger.merge_subtitle_files(
                         chinese_path=chinese_path,
                         english_path=english_path,
-                        output_path=Path(output_path) if output_path else None,
+                        output_path=output_path,
                         output_format=output_format
                     )
                     if success:
@@ -2416,8 +3143,7 @@ After installation, restart this application."""
                 elif chinese_path or english_path:
                     # One external file - need video for the other
                     if not video_path:
-                        self.root.after(0, lambda: messagebox.showerror("Error",
-                            "Need video file to extract missing subtitle track"))
+                        self.root.after(0, messagebox.showerror, "Error", "Need video file to extract missing subtitle track")
                         return
 
                     success = merger.process_video(
@@ -2425,34 +3151,34 @@ After installation, restart this application."""
                         chinese_sub=chinese_path,
                         english_sub=english_path,
                         output_format=output_format,
-                        output_path=Path(output_path) if output_path else None
+                        output_path=output_path
                     )
                 else:
                     # Full auto - use video
                     if not video_path:
-                        self.root.after(0, lambda: messagebox.showerror("Error",
-                            "Please select a video or subtitle files"))
+                        self.root.after(0, messagebox.showerror, "Error", "Please select a video or subtitle files")
                         return
 
                     success = merger.process_video(
                         video_path=Path(video_path),
                         output_format=output_format,
-                        output_path=Path(output_path) if output_path else None
+                        output_path=output_path
                     )
 
                 if success:
-                    self.root.after(0, lambda: messagebox.showinfo("Success", "Subtitles merged successfully!"))
+                    self.root.after(0, messagebox.showinfo, "Success", "Subtitles merged successfully!")
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Merge failed - check log for details"))
+                    self.root.after(0, messagebox.showerror, "Error", "Merge failed - check log for details")
 
             except Exception as e:
                 logger.error(f"Merge failed with exception: {e}", exc_info=True)
                 self.root.after(0, lambda err=str(e): messagebox.showerror("Error", f"Merge failed: {err}"))
             finally:
-                self.root.after(0, lambda: self._set_status("Ready"))
+                self.root.after(0, self._set_status, "Ready")
 
         # Show progress and disable button
         self._set_status("Merging: Starting...")
+        self._idle_ticks = 0
         self.merge_btn.config(state='disabled')
         self.merge_progress_label.pack(side=tk.LEFT, padx=(0, 5))
         self.merge_progress.pack(side=tk.LEFT, padx=(0, 10))
@@ -2463,12 +3189,13 @@ After installation, restart this application."""
                 run_merge()
             finally:
                 # Re-enable button and hide progress
-                self.root.after(0, lambda: self.merge_btn.config(state='normal'))
-                self.root.after(0, lambda: self.merge_progress.pack_forget())
-                self.root.after(0, lambda: self.merge_progress_label.pack_forget())
-                self.root.after(0, lambda: self.merge_progress.configure(value=0))
+                self._ui(lambda: self.merge_btn.config(state='normal'),
+                         self.merge_progress.pack_forget,
+                         self.merge_progress_label.pack_forget,
+                         lambda: self.merge_progress.configure(value=0))
+                self._wake_queue_drain()
 
-        threading.Thread(target=run_merge_with_cleanup, daemon=True).start()
+        self._executor.submit(run_merge_with_cleanup)
 
     def _execute_batch(self):
         """Execute batch operation."""
@@ -2477,7 +3204,7 @@ After installation, restart this application."""
             messagebox.showerror("Error", "Please select a directory")
             return
 
-        if not Path(directory).exists():
+        if not os.path.isdir(directory):
             messagebox.showerror("Error", f"Directory not found: {directory}")
             return
 
@@ -2487,77 +3214,97 @@ After installation, restart this application."""
         auto_confirm = self.batch_autoconfirm_var.get()
 
         def run_batch():
+            summary = None
             try:
                 from processors.batch_processor import BatchProcessor
                 from utils.file_operations import FileHandler
 
-                batch_processor = BatchProcessor(auto_confirm=auto_confirm)
-
                 if operation == "convert":
                     files = FileHandler.find_subtitle_files(Path(directory), recursive)
                     total = len(files)
 
                     if total == 0:
-                        self.root.after(0, lambda: messagebox.showinfo("Info", "No subtitle files found"))
+                        self.root.after(0, messagebox.showinfo, "Info", "No subtitle files found")
                         return
 
                     if not auto_confirm:
                         if not messagebox.askyesno("Confirm", f"Convert {total} files to UTF-8?"):
                             return
 
-                    self.root.after(0, lambda: self.batch_progress_var.set(f"Processing {total} files..."))
+                    self._post_batch_progress(f"Processing {total} files...")
+
+                    batch_processor = _convert_batch_processor(total, auto_confirm)
 
                     results = batch_processor.process_subtitles_batch(
                         subtitle_paths=files,
                         operation="convert",
+                        progress_callback=lambda done, total: self._post_batch_progress(
+                            f"Converted {done}/{total} files...", done, total),
                         keep_backup=create_backup
                     )
 
-                    msg = f"Completed!\nProcessed: {results['processed']}\nFailed: {results['failed']}"
-                    self.root.after(0, lambda: messagebox.showinfo("Complete", msg))
+                    summary = (f"Completed: {results['successful']} converted, "
+                               f"{results['unchanged']} unchanged, {results['failed']} failed")
 
                 else:  # merge
                     files = FileHandler.find_video_files(Path(directory), recursive)
                     total = len(files)
 
                     if total == 0:
-                        self.root.after(0, lambda: messagebox.showinfo("Info", "No video files found"))
+                        self.root.after(0, messagebox.showinfo, "Info", "No video files found")
                         return
 
                     if not auto_confirm:
                         if not messagebox.askyesno("Confirm", f"Process {total} video files?"):
                             return
 
-                    self.root.after(0, lambda: self.batch_progress_var.set(f"Processing {total} videos..."))
+                    self._post_batch_progress(f"Processing {total} videos...")
 
+                    batch_processor = BatchProcessor(auto_confirm=auto_confirm)
                     results = batch_processor.process_directory_interactive(
                         directory=Path(directory),
                         pattern="*"
                     )
 
-                    msg = f"Completed!\nSuccessful: {results['successful']}\nFailed: {results['failed']}\nSkipped: {results['skipped']}"
-                    self.root.after(0, lambda: messagebox.showinfo("Complete", msg))
+                    summary = (f"Completed: {results['successful']} successful, "
+                               f"{results['failed']} failed, {results['skipped']} skipped")
+
+                # Report the outcome in the log and progress label; only
+                # failures are worth interrupting the user with a dialog
+                logger.info(f"Batch {operation}: {summary}")
+                self._wake_queue_drain()
+                if results['failed']:
+                    self.root.after(0, messagebox.showwarning, "Completed with errors",
+                                    f"{results['failed']} file(s) failed - check the log for details")
 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Batch operation failed: {str(e)}"))
+                self.root.after(0, messagebox.showerror, "Error", f"Batch operation failed: {str(e)}")
             finally:
-                self.root.after(0, lambda: self._set_status("Ready"))
-                self.root.after(0, lambda: self.batch_progress_var.set("Ready"))
+                self.root.after(0, self._finish_batch, summary)
 
         self._set_status("Running batch operation...")
+        self._idle_ticks = 0
         self.batch_progress_var.set("Starting...")
-        threading.Thread(target=run_batch, daemon=True).start()
+        self.batch_progress_bar['value'] = 0
+        self._executor.submit(run_batch)
+
+    def _finish_batch(self, summary: Optional[str] = None):
+        """Show the batch outcome (or "Ready") and reset the status bar once a run ends."""
+        # Flush progress still queued so it can't overwrite the summary later
+        self._drain_queues()
+        self.batch_progress_var.set(summary or "Ready")
+        self._set_status("Ready")
 
     def _detect_encoding(self):
         """Detect encoding of the selected file."""
         input_path = self.convert_file_var.get().strip()
-        if not input_path or not Path(input_path).exists():
+        if not input_path or not self._cached_exists(input_path):
             self.detected_encoding_var.set("Select a valid file")
             return
 
         try:
-            from core.encoding_detection import EncodingDetector
-            encoding = EncodingDetector.detect_encoding(Path(input_path))
+            # Re-selecting an unchanged file reuses the earlier result
+            encoding = _file_encoding(input_path)
 
             if encoding:
                 # Encoding detected successfully - show in green
@@ -2576,25 +3323,169 @@ After installation, restart this application."""
         """Update status bar."""
         self.status_var.set(message)
 
+    def _enable_btn(self, button: ttk.Button):
+        """Re-enable a button disabled while its job ran."""
+        button.config(state='normal')
+
+    def _ui(self, *callbacks: Callable):
+        """
+        Run callbacks on the Tk thread in a single after() event.
+
+        Background jobs usually finish by touching several widgets at once;
+        batching them avoids queueing one Tcl event per widget update.
+        """
+        def run():
+            for callback in callbacks:
+                callback()
+
+        self.root.after(0, run)
+
+    def _prewarm_probe(self, path: str):
+        """
+        Start probing a just-picked subtitle file in the background.
+
+        The info panel only asks once the Entry trace's debounce fires; by
+        then the probe has finished or update_info waits on the same one.
+        """
+        if os.path.splitext(path)[1].lower() not in SUBTITLE_EXTENSIONS:
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        if st.st_size:
+            # Same key form as update_info, which holds a Path
+            _submit_probe(self._executor, (str(Path(path)), st.st_mtime_ns, st.st_size))
+
+    def _cached_exists(self, path: str) -> bool:
+        """
+        Check whether a path exists, reusing answers less than two seconds old.
+
+        Entry callbacks fire in bursts (typing, swapping tracks) and would
+        otherwise stat the same path repeatedly, which is slow on network
+        shares. Execute handlers still check the filesystem directly.
+        """
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached is not None and now - cached[0] < EXISTS_CACHE_TTL:
+            return cached[1]
+        exists = os.path.exists(path)
+        if len(self._exists_cache) > 256:
+            self._exists_cache.clear()
+        self._exists_cache[path] = (now, exists)
+        return exists
+
+    def _debounce(self, key: str, callback: Callable, delay: int = TRACE_DEBOUNCE_MS):
+        """
+        Run callback once input has been quiet for delay milliseconds.
+
+        Each call cancels the pending callback for the same key, so a burst of
+        entry trace events (one per keystroke) results in a single call.
+        """
+        job = self._debounce_jobs.pop(key, None)
+        if job is not None:
+            self.root.after_cancel(job)
+
+        def fire():
+            self._debounce_jobs.pop(key, None)
+            callback()
+
+        self._debounce_jobs[key] = self.root.after(delay, fire)
+
     def _clear_log(self):
         """Clear the log text area."""
         self.log_text.config(state='normal')
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state='disabled')
 
+    def _post_batch_progress(self, text: str, done: Optional[int] = None,
+                             total: Optional[int] = None):
+        """Queue batch progress from a worker for the poll loop to show."""
+        percent = 100 * done / total if done is not None and total else None
+        self.batch_progress_queue.put((text, percent))
+        self._queue_activity.set()
+        self._wake_queue_drain()
+
+    def _wake_queue_drain(self):
+        """
+        Have the Tk thread drain the queues now instead of at the next poll.
+
+        Called by workers after they log or post progress, never from
+        LogHandler.emit: root.after must not run under a logging lock (see
+        there). At most one wake-up is outstanding; the poll is a safety net.
+        """
+        if self._drain_wake_pending.is_set():
+            return
+        self._drain_wake_pending.set()
+        try:
+            self.root.after(0, self._drain_on_wake)
+        except (RuntimeError, tk.TclError):
+            # Main loop already gone
+            self._drain_wake_pending.clear()
+
+    def _drain_on_wake(self):
+        """Drain the queues for _wake_queue_drain."""
+        # Clear first so a worker queuing during the drain wakes us again
+        self._drain_wake_pending.clear()
+        self._queue_activity.clear()
+        self._drain_queues()
+        self._idle_ticks = 0
+
     def _poll_log_queue(self):
-        """Poll the log queue and update the text widget."""
+        """Drain the queues periodically, polling faster while workers are active."""
+        # Clear before draining: anything queued after this sets the event
+        # again and is picked up on the next tick
+        if self._queue_activity.is_set():
+            self._queue_activity.clear()
+            self._drain_queues()
+            self._idle_ticks = 0
+        else:
+            self._idle_ticks += 1
+        delay = QUEUE_POLL_MS if self._idle_ticks < QUEUE_IDLE_TICKS else QUEUE_IDLE_POLL_MS
+        self.root.after(delay, self._poll_log_queue)
+
+    def _drain_queues(self) -> bool:
+        """
+        Move queued log records and batch progress into the widgets.
+
+        Returns:
+            True if anything was drained
+        """
+        messages = []
         while True:
             try:
-                msg = self.log_queue.get_nowait()
-                self.log_text.config(state='normal')
-                self.log_text.insert(tk.END, msg + '\n')
+                messages.append(self.log_queue.popleft())
+            except IndexError:
+                break
+
+        # One insert per tick, however many records arrived
+        if messages:
+            # Only follow new output if the user hasn't scrolled up to read
+            at_bottom = self.log_text.yview()[1] >= 1.0
+            self.log_text.config(state='normal')
+            self.log_text.insert(tk.END, '\n'.join(messages) + '\n')
+            # Keep the pane bounded during long runs by dropping the oldest lines
+            lines = int(self.log_text.index('end-1c').split('.')[0])
+            if lines > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{lines - LOG_MAX_LINES + LOG_TRIM_LINES}.0')
+            if at_bottom:
                 self.log_text.see(tk.END)
-                self.log_text.config(state='disabled')
+            self.log_text.config(state='disabled')
+
+        # Progress entries are snapshots, so skip straight to the newest
+        progress = None
+        while True:
+            try:
+                progress = self.batch_progress_queue.get_nowait()
             except queue.Empty:
                 break
+        if progress is not None:
+            text, percent = progress
+            self.batch_progress_var.set(text)
+            if percent is not None:
+                self.batch_progress_bar['value'] = percent
 
-        self.root.after(100, self._poll_log_queue)
+        return bool(messages) or progress is not None
 
     def _show_help(self):
         """Show help dialog."""
@@ -2656,86 +3547,92 @@ Cross-platform: Windows, macOS, Linux
         """
         Show a preview window with subtitle content.
 
+        The file is read in a worker; the window opens once it is parsed.
+
         Args:
             file_path: Path to subtitle file, or None to prompt for file
         """
         if not file_path:
-            filetypes = [("Subtitle files", "*.srt *.ass *.ssa *.vtt"), ("All files", "*.*")]
-            file_path = filedialog.askopenfilename(title="Select Subtitle to Preview", filetypes=filetypes)
+            file_path = filedialog.askopenfilename(title="Select Subtitle to Preview", filetypes=_SUB_FILETYPES)
 
-        if not file_path or not Path(file_path).exists():
+        if not file_path or not os.path.exists(file_path):
             return
 
-        try:
-            from core.subtitle_formats import SubtitleFormatFactory
-            from core.encoding_detection import EncodingDetector
-
-            # Detect encoding and parse file
-            encoding = EncodingDetector.detect_encoding(Path(file_path)) or "Unknown"
-            sub_file = SubtitleFormatFactory.parse_file(Path(file_path))
-
-            # Create preview window
-            preview_win = tk.Toplevel(self.root)
-            preview_win.title(f"Preview: {Path(file_path).name}")
-            preview_win.geometry("700x500")
-            preview_win.transient(self.root)
-
-            # Info header
-            info_frame = ttk.Frame(preview_win, padding="10")
-            info_frame.pack(fill=tk.X)
-
-            ttk.Label(info_frame, text=f"File: {Path(file_path).name}",
-                     font=('TkDefaultFont', 10, 'bold')).pack(anchor='w')
-            ttk.Label(info_frame, text=f"Events: {len(sub_file.events)} | "
-                     f"Encoding: {encoding.upper()} | "
-                     f"Format: {sub_file.format.value.upper()}",
-                     style='Subtitle.TLabel').pack(anchor='w')
-
-            # Separator
-            ttk.Separator(preview_win, orient='horizontal').pack(fill=tk.X, pady=5)
-
-            # Preview text area
-            text_frame = ttk.Frame(preview_win, padding="10")
-            text_frame.pack(fill=tk.BOTH, expand=True)
-
-            preview_text = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD,
-                                                     font=('Consolas', 10))
-            preview_text.pack(fill=tk.BOTH, expand=True)
-
-            # Display subtitle content (first 50 events for performance)
-            preview_content = []
-            max_events = min(50, len(sub_file.events))
-
-            for i, event in enumerate(sub_file.events[:max_events]):
-                # Format timestamp
-                start_h = int(event.start // 3600)
-                start_m = int((event.start % 3600) // 60)
-                start_s = event.start % 60
-                end_h = int(event.end // 3600)
-                end_m = int((event.end % 3600) // 60)
-                end_s = event.end % 60
-
-                timestamp = f"{start_h:02d}:{start_m:02d}:{start_s:06.3f} --> {end_h:02d}:{end_m:02d}:{end_s:06.3f}"
-                preview_content.append(f"[{i+1}] {timestamp}")
-                preview_content.append(event.text)
-                preview_content.append("")
-
-            if len(sub_file.events) > max_events:
-                preview_content.append(f"... ({len(sub_file.events) - max_events} more events not shown)")
-
-            preview_text.insert(tk.END, "\n".join(preview_content))
-            preview_text.config(state='disabled')
-
-            # Close button
-            ttk.Button(preview_win, text="Close",
-                      command=preview_win.destroy).pack(pady=10)
+        def do_load():
+            try:
+                from core.subtitle_formats import SubtitleFormatFactory
+
+                # Detect encoding and parse only the events the window shows,
+                # plus one to tell whether the file has more
+                encoding = _file_encoding(file_path) or "Unknown"
+                sub_file = SubtitleFormatFactory.parse_file(
+                    Path(file_path), max_events=PREVIEW_MAX_EVENTS + 1)
+                self.root.after(0, self._open_preview_window, file_path, encoding, sub_file)
+            except Exception as e:
+                self.root.after(0, messagebox.showerror, "Preview Error", f"Could not preview file:\n{e}")
+
+        self._executor.submit(do_load)
+
+    def _open_preview_window(self, file_path: str, encoding: str, sub_file):
+        """Create the preview window for a parsed subtitle file."""
+        shown = sub_file.events[:PREVIEW_MAX_EVENTS]
+        truncated = len(sub_file.events) > len(shown)
+        event_count = f"{len(shown)}+" if truncated else str(len(shown))
+        name = os.path.basename(file_path)
+
+        # Create preview window
+        preview_win = tk.Toplevel(self.root)
+        preview_win.title(f"Preview: {name}")
+        preview_win.geometry("700x500")
+        preview_win.transient(self.root)
+
+        # Info header
+        info_frame = ttk.Frame(preview_win, padding="10")
+        info_frame.pack(fill=tk.X)
+
+        ttk.Label(info_frame, text=f"File: {name}",
+                 font='BissHeading').pack(anchor='w')
+        ttk.Label(info_frame, text=f"Events: {event_count} | "
+                 f"Encoding: {encoding.upper()} | "
+                 f"Format: {sub_file.format.value.upper()}",
+                 style='Subtitle.TLabel').pack(anchor='w')
 
-        except Exception as e:
-            messagebox.showerror("Preview Error", f"Could not preview file:\n{e}")
+        # Separator
+        ttk.Separator(preview_win, orient='horizontal').pack(fill=tk.X, pady=5)
+
+        # Preview text area
+        text_frame = ttk.Frame(preview_win, padding="10")
+        text_frame.pack(fill=tk.BOTH, expand=True)
+
+        preview_text = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD,
+                                                 font='BissPreviewMono')
+        preview_text.pack(fill=tk.BOTH, expand=True)
+
+        # Display subtitle content (first events only, for performance)
+        preview_content = "\n".join(
+            f"[{i}] {_format_preview_time(event.start)} --> {_format_preview_time(event.end)}\n"
+            f"{event.text}\n"
+            for i, event in enumerate(shown, 1))
+
+        if truncated:
+            preview_content += "\n... (more events not shown)"
+
+        preview_text.insert(tk.END, preview_content)
+        preview_text.config(state='disabled')
+
+        # Close button
+        ttk.Button(preview_win, text="Close",
+                  command=preview_win.destroy).pack(pady=10)
 
     def run(self):
         """Run the GUI application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if sys.version_info >= (3, 9):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._executor.shutdown(wait=False)
 
 
 def main():
@@ -53,6 +53,9 @@ VIDEO_EXTENSIONS: Set[str] = {
 # Supported subtitle file extensions
 SUBTITLE_EXTENSIONS: Set[str] = {'.srt', '.ass', '.ssa', '.vtt'}
 
+# Subtitle files smaller than this (bytes) cannot hold a single cue
+MIN_SUBTITLE_FILE_SIZE: int = 16
+
 # ============================================================================
 # LANGUAGE DETECTION CONSTANTS
 # ============================================================================
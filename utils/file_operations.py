@@ -13,8 +13,8 @@ import shutil
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple, Generator
-from .constants import BACKUP_DIR_NAME, SUBTITLE_EXTENSIONS, VIDEO_EXTENSIONS
+from typing import List, Optional, Set, Tuple, Generator
+from .constants import BACKUP_DIR_NAME, MIN_SUBTITLE_FILE_SIZE, SUBTITLE_EXTENSIONS, VIDEO_EXTENSIONS
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -120,19 +120,11 @@ class FileHandler:
             logger.warning(f"Directory not found or not a directory: {directory}")
             return []
         
-        subtitle_files = []
-        
-        if recursive:
-            pattern_func = directory.rglob
-        else:
-            pattern_func = directory.glob
-        
-        for ext in SUBTITLE_EXTENSIONS:
-            pattern = f"*{ext}"
-            subtitle_files.extend(pattern_func(pattern))
-        
-        # Sort for consistent ordering
-        subtitle_files.sort()
+        # Sort for consistent ordering (as strings, before building Paths)
+        subtitle_files = [Path(p) for p in sorted(
+            FileHandler._scan_files(str(directory), SUBTITLE_EXTENSIONS, recursive,
+                                    min_size=MIN_SUBTITLE_FILE_SIZE),
+            key=FileHandler._path_sort_key)]
         
         logger.debug(f"Found {len(subtitle_files)} subtitle files in {directory}")
         return subtitle_files
@@ -157,22 +149,77 @@ class FileHandler:
             logger.warning(f"Directory not found or not a directory: {directory}")
             return []
         
-        video_files = []
+        # Sort for consistent ordering (as strings, before building Paths)
+        video_files = [Path(p) for p in sorted(
+            FileHandler._scan_files(str(directory), VIDEO_EXTENSIONS, recursive),
+            key=FileHandler._path_sort_key)]
         
-        if recursive:
-            pattern_func = directory.rglob
-        else:
-            pattern_func = directory.glob
+        logger.debug(f"Found {len(video_files)} video files in {directory}")
+        return video_files
+    
+    @staticmethod
+    def _scan_files(directory: str, extensions: Set[str], recursive: bool,
+                    min_size: int = 0) -> Generator[str, None, None]:
+        """
+        Yield paths of files under directory whose extension is in extensions.
         
-        for ext in VIDEO_EXTENSIONS:
-            pattern = f"*{ext}"
-            video_files.extend(pattern_func(pattern))
+        Walks the tree with os.scandir in a single pass, so file type checks
+        reuse the information returned by the directory listing instead of
+        issuing a stat() per entry and per extension. Names are filtered by
+        extension before any type check, so non-media entries cost nothing.
+        Extensions are matched case-insensitively. Hidden directories (names
+        starting with a dot, such as .git or .Trash) and symlinked directories
+        are not descended into, and unreadable directories are skipped. A
+        non-recursive scan lists only the top directory.
         
-        # Sort for consistent ordering
-        video_files.sort()
+        Args:
+            directory: Directory to search
+            extensions: Lower-case extensions including the dot (e.g. '.srt')
+            recursive: Whether to descend into subdirectories
+            min_size: Skip matching files smaller than this many bytes
+            
+        Yields:
+            File paths as strings
+        """
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot:].lower() in extensions and entry.is_file():
+                        if min_size and FileHandler._entry_size(entry) < min_size:
+                            logger.debug(f"Skipping empty or truncated file: {entry.path}")
+                            continue
+                        yield entry.path
+                    elif (recursive and not name.startswith('.')
+                          and entry.is_dir(follow_symlinks=False)):
+                        subdirs.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+            return
         
-        logger.debug(f"Found {len(video_files)} video files in {directory}")
-        return video_files
+        for subdir in subdirs:
+            yield from FileHandler._scan_files(subdir, extensions, recursive, min_size)
+    
+    @staticmethod
+    def _entry_size(entry: os.DirEntry) -> int:
+        """Size of a directory entry in bytes, or 0 if it cannot be read."""
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return 0
+    
+    @staticmethod
+    def _path_sort_key(path: str) -> List[str]:
+        """
+        Sort key giving path strings the same order as sorting Path objects.
+        
+        Path compares component by component (case-insensitively on Windows);
+        comparing the split strings does the same without building a Path
+        per entry, which roughly halves the cost for large scans.
+        """
+        return os.path.normcase(path).split(os.sep)
     
     @staticmethod
     def find_matching_pairs(directory: Path, source_ext: str, 